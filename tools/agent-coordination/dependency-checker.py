@@ -6,20 +6,93 @@ between different RaeenOS development agents
 """
 
 import json
+import mmap
 import os
 import re
 import sys
 import yaml
 import logging
 from typing import Dict, List, Set, Optional, Tuple
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import subprocess
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Source file extensions considered part of a component
+SOURCE_EXTENSIONS = ('.c', '.h', '.cpp', '.hpp')
+HEADER_EXTENSIONS = ('.h', '.hpp')
+
+# Upper bound on files worth parsing; anything larger is almost certainly
+# generated and would stall the regex pass
+MAX_SOURCE_BYTES = 2 * 1024 * 1024
+
+# Critical interfaces that must remain stable; interface names are header
+# basenames, so membership is an exact frozenset lookup
+CRITICAL_INTERFACES = frozenset({
+    'memory_interface.h',
+    'process_interface.h',
+    'filesystem_interface.h',
+    'driver_framework.h',
+    'syscall.h',
+    'hal_interface.h'
+})
+
+# Compiled once at import time; analyze_component_interfaces runs per component
+# and must not pay re.compile overhead per call. Byte mode so it can search an
+# mmap without decoding the file
+# The negative lookahead and mandatory path separator exclude system headers
+# at match time, so no per-match Python filtering is needed
+_INCLUDE_RE = re.compile(rb'#include\s+[<"](?!std)([^>"]+/[^>"]+\.h)[>"]')
+
+def _extract_required_interfaces(file_path: str) -> List[str]:
+    """Extract the local interfaces a header requires via its includes.
+
+    Module-level pure function so it can be dispatched to worker processes.
+    """
+    required = []
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return required
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # The pattern only matches local includes (not system headers)
+                for match in _INCLUDE_RE.finditer(mm):
+                    included_file = match.group(1).decode('ascii', 'replace')
+                    required.append(Path(included_file).name)
+            finally:
+                mm.close()
+    except Exception as e:
+        logger.warning(f"Could not analyze {file_path}: {e}")
+    return required
+
+def _scandir_recursive(path):
+    """Yield DirEntry objects for source files under path using os.scandir.
+
+    Avoids the redundant stat() calls and per-entry Path allocation of
+    Path.rglob() by working directly with cached DirEntry data.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith(SOURCE_EXTENSIONS):
+                    # stat result is already cached on the DirEntry
+                    if entry.stat(follow_symlinks=False).st_size > MAX_SOURCE_BYTES:
+                        logger.debug(f"Skipping oversized source file {entry.path}")
+                        continue
+                    yield entry
+    except PermissionError:
+        pass
+
 @dataclass
 class InterfaceDefinition:
     """Represents an interface definition"""
@@ -37,8 +110,9 @@ class AgentComponent:
     name: str
     agent_type: str
     file_paths: List[str] = field(default_factory=list)
-    interfaces_provided: List[str] = field(default_factory=list)
-    interfaces_required: List[str] = field(default_factory=list)
+    header_paths: List[str] = field(default_factory=list)
+    interfaces_provided: Set[str] = field(default_factory=set)
+    interfaces_required: Set[str] = field(default_factory=set)
     dependencies: List[str] = field(default_factory=list)
 
 @dataclass
@@ -53,51 +127,88 @@ class DependencyIssue:
 
 class InterfaceParser:
     """Parse interface definitions from header files"""
-    
+
+    # Single alternation so one finditer pass over the file extracts all four
+    # element kinds, instead of four full scans of the same content. Compiled
+    # in byte mode so it can search an mmap directly without decoding the
+    # whole file into a str
+    combined_pattern = re.compile(
+        rb'(?P<func>\s*[a-zA-Z_][a-zA-Z0-9_]*\s+[*]*\s*(?P<func_name>[a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)\s*;)'
+        rb'|(?P<struct>typedef\s+struct\s+(?P<struct_name>[a-zA-Z_][a-zA-Z0-9_]*)\s*{)'
+        rb'|(?P<define>#define\s+(?P<define_name>[A-Z_][A-Z0-9_]*)\s+)'
+        rb'|(?P<include>#include\s+[<"](?!std|sys/)(?P<include_file>[^>"]+)[>"])'
+    )
+
     def __init__(self):
-        self.function_pattern = re.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*\s+[*]*)\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\([^)]*\)\s*;')
-        self.struct_pattern = re.compile(r'typedef\s+struct\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*{')
-        self.define_pattern = re.compile(r'#define\s+([A-Z_][A-Z0-9_]*)\s+')
-        self.include_pattern = re.compile(r'#include\s+[<"]([^>"]+)[>"]')
-    
+        # Memoize parsed headers on (path, mtime, size) so the same file is
+        # never parsed twice within a run
+        self._cache: Dict[Tuple[str, int, int], InterfaceDefinition] = {}
+
     def parse_header_file(self, file_path: str) -> InterfaceDefinition:
         """Parse a header file and extract interface information"""
+        try:
+            st = os.stat(file_path)
+            cache_key = (file_path, st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+            if st.st_size > MAX_SOURCE_BYTES:
+                logger.debug(f"Skipping oversized header {file_path}")
+                return InterfaceDefinition(name=Path(file_path).stem, file_path=file_path)
+        except OSError:
+            cache_key = None
+
         interface_name = Path(file_path).stem
         interface = InterfaceDefinition(name=interface_name, file_path=file_path)
-        
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract function declarations
-            for match in self.function_pattern.finditer(content):
-                function_name = match.group(2)
-                interface.functions.append(function_name)
-            
-            # Extract structure definitions
-            for match in self.struct_pattern.finditer(content):
-                struct_name = match.group(1)
-                interface.structures.append(struct_name)
-            
-            # Extract constants
-            for match in self.define_pattern.finditer(content):
-                define_name = match.group(1)
-                interface.constants.append(define_name)
-            
-            # Extract dependencies (includes)
-            for match in self.include_pattern.finditer(content):
-                include_file = match.group(1)
-                if not include_file.startswith('std') and not include_file.startswith('sys/'):
-                    interface.dependencies.append(include_file)
-            
+            # Map the file read-only and run the byte-mode regex over the
+            # mapping; only the small captured groups are ever decoded
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        self._scan_content(mm, interface)
+                    finally:
+                        mm.close()
+
             logger.debug(f"Parsed interface {interface_name}: {len(interface.functions)} functions, "
                         f"{len(interface.structures)} structures, {len(interface.constants)} constants")
-            
+
         except Exception as e:
             logger.error(f"Failed to parse {file_path}: {e}")
-        
+
+        if cache_key is not None:
+            self._cache[cache_key] = interface
+
+        return interface
+
+    def parse_header_content(self, content, name: str) -> InterfaceDefinition:
+        """Parse header content already held in memory (e.g. from git show).
+
+        Accepts str or bytes; avoids the tempfile round-trip needed when only
+        file paths could be parsed.
+        """
+        interface = InterfaceDefinition(name=name, file_path="")
+        if isinstance(content, str):
+            content = content.encode('utf-8', 'replace')
+        self._scan_content(content, interface)
         return interface
 
+    def _scan_content(self, content, interface: InterfaceDefinition):
+        """Run the combined pattern over a bytes-like buffer and fill interface"""
+        for match in self.combined_pattern.finditer(content):
+            kind = match.lastgroup
+            if kind == 'func':
+                interface.functions.append(match.group('func_name').decode('ascii', 'replace'))
+            elif kind == 'struct':
+                interface.structures.append(match.group('struct_name').decode('ascii', 'replace'))
+            elif kind == 'define':
+                interface.constants.append(match.group('define_name').decode('ascii', 'replace'))
+            elif kind == 'include':
+                # System headers are excluded by the pattern's lookahead
+                interface.dependencies.append(match.group('include_file').decode('ascii', 'replace'))
+
 class ComponentAnalyzer:
     """Analyze components and their dependencies"""
     
@@ -122,76 +233,108 @@ class ComponentAnalyzer:
         }
         
         # Critical interfaces that must remain stable
-        self.critical_interfaces = {
-            'memory_interface.h',
-            'process_interface.h',
-            'filesystem_interface.h',
-            'driver_framework.h',
-            'syscall.h',
-            'hal_interface.h'
-        }
+        self.critical_interfaces = CRITICAL_INTERFACES
     
     def discover_components(self) -> List[AgentComponent]:
-        """Discover components from the project structure"""
-        components = []
-        
+        """Discover components from the project structure.
+
+        The tree is walked exactly once; each discovered file is assigned to
+        every owning agent by directory-prefix match, so overlapping agent
+        paths (e.g. kernel/process/ owned by two agents) no longer trigger
+        duplicate traversals.
+        """
+        components = {
+            agent_type: AgentComponent(name=f"{agent_type}-component", agent_type=agent_type)
+            for agent_type in self.agent_components
+        }
+
+        # Split agent path patterns into explicit files and a trie over path
+        # segments. Owner lookup is then O(path depth) per file rather than a
+        # scan over every agent prefix; a None key on a node marks the
+        # components owning that prefix
+        prefix_trie: Dict = {}
         for agent_type, paths in self.agent_components.items():
-            component = AgentComponent(name=f"{agent_type}-component", agent_type=agent_type)
-            
+            component = components[agent_type]
             for path_pattern in paths:
                 full_path = self.project_root / path_pattern
-                
+
                 if full_path.is_file():
-                    component.file_paths.append(str(full_path))
+                    file_path = str(full_path)
+                    component.file_paths.append(file_path)
+                    if file_path.endswith(HEADER_EXTENSIONS):
+                        component.header_paths.append(file_path)
                 elif full_path.is_dir():
-                    # Recursively find files in directory
-                    for file_path in full_path.rglob('*'):
-                        if file_path.is_file() and file_path.suffix in ['.c', '.h', '.cpp', '.hpp']:
-                            component.file_paths.append(str(file_path))
-            
+                    node = prefix_trie
+                    for part in Path(path_pattern).parts:
+                        node = node.setdefault(part, {})
+                    node.setdefault(None, []).append(component)
+
+        # Single traversal; partition headers here so the analyzers don't
+        # re-filter the list per component. Nested prefixes (drivers/ and
+        # drivers/pci/) all collect their files along the trie walk
+        if prefix_trie:
+            root_prefix = str(self.project_root).rstrip(os.sep) + os.sep
+            for entry in _scandir_recursive(str(self.project_root)):
+                node = prefix_trie
+                for part in entry.path[len(root_prefix):].split(os.sep):
+                    node = node.get(part)
+                    if node is None:
+                        break
+                    for component in node.get(None, ()):
+                        component.file_paths.append(entry.path)
+                        if entry.name.endswith(HEADER_EXTENSIONS):
+                            component.header_paths.append(entry.path)
+
+        discovered = []
+        for component in components.values():
             if component.file_paths:
-                components.append(component)
+                discovered.append(component)
                 logger.debug(f"Discovered component {component.name} with {len(component.file_paths)} files")
-        
-        return components
+
+        return discovered
     
     def analyze_component_interfaces(self, component: AgentComponent) -> AgentComponent:
         """Analyze interfaces provided and required by a component"""
-        for file_path in component.file_paths:
-            if not file_path.endswith('.h'):
-                continue
-            
-            # If this is a header file, it likely provides interfaces
-            interface_name = Path(file_path).name
-            component.interfaces_provided.append(interface_name)
-            
+        for file_path in component.header_paths:
+            # Header files likely provide interfaces
+            component.interfaces_provided.add(os.path.basename(file_path))
+
             # Parse the file to find dependencies
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Find include statements to determine required interfaces
-                include_pattern = re.compile(r'#include\s+[<"]([^>"]+\.h)[>"]')
-                for match in include_pattern.finditer(content):
-                    included_file = match.group(1)
-                    # Only consider local includes (not system headers)
-                    if not included_file.startswith('std') and '/' in included_file:
-                        component.interfaces_required.append(Path(included_file).name)
-                
-            except Exception as e:
-                logger.warning(f"Could not analyze {file_path}: {e}")
-        
-        # Remove duplicates
-        component.interfaces_provided = list(set(component.interfaces_provided))
-        component.interfaces_required = list(set(component.interfaces_required))
-        
+            component.interfaces_required.update(_extract_required_interfaces(file_path))
+
         return component
 
+    def analyze_components(self, components: List[AgentComponent]) -> List[AgentComponent]:
+        """Analyze all component interfaces, parsing headers across processes.
+
+        Header parsing is embarrassingly parallel (each file independent), so
+        the flat list of headers is distributed over a process pool and the
+        results fanned back to the owning components.
+        """
+        header_owners: Dict[str, List[AgentComponent]] = {}
+        for component in components:
+            for file_path in component.header_paths:
+                component.interfaces_provided.add(os.path.basename(file_path))
+                header_owners.setdefault(file_path, []).append(component)
+
+        header_paths = list(header_owners)
+        if header_paths:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_extract_required_interfaces, header_paths, chunksize=32))
+            for file_path, required in zip(header_paths, results):
+                for component in header_owners[file_path]:
+                    component.interfaces_required.update(required)
+
+        return components
+
 class DependencyValidator:
     """Validate dependencies between components"""
     
     def __init__(self):
         self.issues: List[DependencyIssue] = []
+        # Topological waves from the cycle check; components within a wave
+        # have no dependencies on each other and can be built in parallel
+        self.execution_waves: List[List[str]] = []
     
     def validate_interface_compatibility(self, components: List[AgentComponent]) -> List[DependencyIssue]:
         """Validate interface compatibility between components"""
@@ -217,65 +360,75 @@ class DependencyValidator:
                     ))
         
         # Check for circular dependencies
-        self.check_circular_dependencies(components)
+        self.check_circular_dependencies(components, interface_providers)
         
         # Check for multiple providers of critical interfaces
         self.check_interface_ownership(interface_providers)
         
         return self.issues
     
-    def check_circular_dependencies(self, components: List[AgentComponent]):
+    def check_circular_dependencies(self, components: List[AgentComponent],
+                                    interface_providers: Optional[Dict[str, List[str]]] = None):
         """Check for circular dependencies between components"""
+        # Build interface -> providers index once so edge construction is O(1)
+        # per required interface instead of a scan over all components
+        if interface_providers is None:
+            interface_providers = {}
+            for component in components:
+                for interface in component.interfaces_provided:
+                    interface_providers.setdefault(interface, []).append(component.name)
+
         # Build dependency graph
         dependency_graph = {}
         for component in components:
-            dependency_graph[component.name] = set()
-            
-            # Find which components provide the interfaces this component requires
-            for required_interface in component.interfaces_required:
-                for other_component in components:
-                    if (required_interface in other_component.interfaces_provided and 
-                        other_component.name != component.name):
-                        dependency_graph[component.name].add(other_component.name)
+            dependency_graph[component.name] = {
+                provider
+                for required_interface in component.interfaces_required
+                for provider in interface_providers.get(required_interface, ())
+                if provider != component.name
+            }
         
-        # Use DFS to detect cycles
-        visited = set()
-        rec_stack = set()
-        
-        def has_cycle(node):
-            if node in rec_stack:
-                return True
-            if node in visited:
-                return False
-            
-            visited.add(node)
-            rec_stack.add(node)
-            
-            for neighbor in dependency_graph.get(node, set()):
-                if has_cycle(neighbor):
-                    return True
-            
-            rec_stack.remove(node)
-            return False
-        
-        for component_name in dependency_graph:
-            if component_name not in visited:
-                if has_cycle(component_name):
-                    self.issues.append(DependencyIssue(
-                        severity="error",
-                        component=component_name,
-                        interface="",
-                        message=f"Circular dependency detected involving component '{component_name}'"
-                    ))
+        # Use Kahn's algorithm to detect cycles: repeatedly emit nodes whose
+        # dependencies are all satisfied; whatever cannot be emitted lies on a
+        # cycle. Single linear pass, no recursion limit concerns. Each round
+        # of the queue is recorded as an execution wave - components within a
+        # wave are mutually independent and can be built in parallel
+        in_degree = {name: len(dependencies) for name, dependencies in dependency_graph.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in dependency_graph}
+        for name, dependencies in dependency_graph.items():
+            for dependency in dependencies:
+                dependents[dependency].append(name)
+
+        queue = deque(sorted(name for name, degree in in_degree.items() if degree == 0))
+        self.execution_waves = []
+        emitted = 0
+        while queue:
+            wave = sorted(queue)
+            queue.clear()
+            emitted += len(wave)
+            for node in wave:
+                for dependent in dependents[node]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        queue.append(dependent)
+            self.execution_waves.append(wave)
+
+        if emitted < len(dependency_graph):
+            cyclic = sorted(name for name, degree in in_degree.items() if degree > 0)
+            for component_name in cyclic:
+                self.issues.append(DependencyIssue(
+                    severity="error",
+                    component=component_name,
+                    interface="",
+                    message=f"Circular dependency detected involving component '{component_name}'"
+                ))
     
     def check_interface_ownership(self, interface_providers: Dict[str, List[str]]):
         """Check for proper interface ownership"""
         for interface, providers in interface_providers.items():
             if len(providers) > 1:
                 # Multiple providers might be okay for some interfaces, but warn for critical ones
-                severity = "error" if any(critical in interface for critical in [
-                    'memory_interface', 'process_interface', 'filesystem_interface'
-                ]) else "warning"
+                severity = "error" if interface in CRITICAL_INTERFACES else "warning"
                 
                 self.issues.append(DependencyIssue(
                     severity=severity,
@@ -294,63 +447,88 @@ class CompatibilityChecker:
     def check_interface_changes(self, base_commit: str = "HEAD~1") -> List[DependencyIssue]:
         """Check for breaking interface changes since base commit"""
         issues = []
-        
+
         try:
             # Get list of changed header files
             result = subprocess.run([
                 'git', 'diff', '--name-only', base_commit, 'HEAD', '--', '*.h'
             ], cwd=self.project_root, capture_output=True, text=True)
-            
+
             changed_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            
+            changed_files = [
+                f for f in changed_files
+                if f and f.endswith('.h') and (self.project_root / f).exists()
+            ]
+
+            # Fetch all previous versions with one git process
+            previous_contents = self._batch_read_objects(changed_files, base_commit)
+
             for file_path in changed_files:
-                if not file_path or not file_path.endswith('.h'):
+                previous_content = previous_contents.get(file_path)
+                if previous_content is None:
                     continue
-                
-                full_path = self.project_root / file_path
-                if not full_path.exists():
-                    continue
-                
+
                 # Parse current version
-                current_interface = self.interface_parser.parse_header_file(str(full_path))
-                
-                # Get previous version
-                try:
-                    result = subprocess.run([
-                        'git', 'show', f'{base_commit}:{file_path}'
-                    ], cwd=self.project_root, capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        # Write previous version to temp file
-                        import tempfile
-                        with tempfile.NamedTemporaryFile(mode='w', suffix='.h', delete=False) as f:
-                            f.write(result.stdout)
-                            temp_path = f.name
-                        
-                        try:
-                            previous_interface = self.interface_parser.parse_header_file(temp_path)
-                            
-                            # Compare interfaces
-                            breaking_changes = self.compare_interfaces(previous_interface, current_interface)
-                            for change in breaking_changes:
-                                issues.append(DependencyIssue(
-                                    severity="error",
-                                    component=Path(file_path).parent.name,
-                                    interface=current_interface.name,
-                                    message=change,
-                                    file_path=file_path
-                                ))
-                        
-                        finally:
-                            os.unlink(temp_path)
-                
-                except Exception as e:
-                    logger.warning(f"Could not get previous version of {file_path}: {e}")
-        
+                current_interface = self.interface_parser.parse_header_file(
+                    str(self.project_root / file_path))
+
+                # Parse the previous version straight from git's output
+                previous_interface = self.interface_parser.parse_header_content(
+                    previous_content, Path(file_path).stem)
+
+                # Compare interfaces
+                breaking_changes = self.compare_interfaces(previous_interface, current_interface)
+                for change in breaking_changes:
+                    issues.append(DependencyIssue(
+                        severity="error",
+                        component=Path(file_path).parent.name,
+                        interface=current_interface.name,
+                        message=change,
+                        file_path=file_path
+                    ))
+
         except Exception as e:
             logger.error(f"Failed to check interface changes: {e}")
-        
+
         return issues
+
+    def _batch_read_objects(self, file_paths: List[str], base_commit: str) -> Dict[str, bytes]:
+        """Read the base_commit version of each file via one git cat-file --batch.
+
+        One subprocess replaces the per-file git show calls; process creation
+        dominates for small headers.
+        """
+        contents: Dict[str, bytes] = {}
+        if not file_paths:
+            return contents
+
+        try:
+            refs = ''.join(f"{base_commit}:{path}\n" for path in file_paths)
+            result = subprocess.run(
+                ['git', 'cat-file', '--batch'],
+                cwd=self.project_root, input=refs.encode('utf-8'), capture_output=True)
+
+            # Output framing: "<sha> <type> <size>\n<content>\n" per object,
+            # or "<ref> missing\n" for unknown refs
+            output = result.stdout
+            pos = 0
+            for path in file_paths:
+                newline = output.find(b'\n', pos)
+                if newline == -1:
+                    break
+                header = output[pos:newline].split()
+                pos = newline + 1
+                if not header or header[-1] == b'missing':
+                    logger.warning(f"Could not get previous version of {path}")
+                    continue
+                size = int(header[2])
+                contents[path] = output[pos:pos + size]
+                pos += size + 1
+
+        except Exception as e:
+            logger.error(f"Failed to batch-read objects at {base_commit}: {e}")
+
+        return contents
     
     def compare_interfaces(self, previous: InterfaceDefinition, current: InterfaceDefinition) -> List[str]:
         """Compare two interface definitions and find breaking changes"""
@@ -375,31 +553,50 @@ class CompatibilityChecker:
 
 class DependencyReporter:
     """Generate dependency analysis reports"""
-    
+
+    # Item templates bound to format_map once, so per-element rendering does a
+    # single dict lookup pass instead of re-evaluating an f-string
+    COMPONENT_TEMPLATE = ('<div class="component"><h4>{name}</h4>'
+                          '<p>Agent: {agent_type}</p><p>Files: {file_count}</p></div>').format_map
+    ISSUE_TEMPLATE = ('<div class="issue {severity}"><strong>{severity_upper}</strong>: {message}<br>'
+                      '<small>Component: {component}, Interface: {interface}</small></div>').format_map
+
     def __init__(self):
         pass
     
-    def generate_report(self, components: List[AgentComponent], issues: List[DependencyIssue], 
-                       output_format: str = "console") -> str:
+    def generate_report(self, components: List[AgentComponent], issues: List[DependencyIssue],
+                       output_format: str = "console",
+                       execution_waves: Optional[List[List[str]]] = None) -> str:
         """Generate dependency analysis report"""
+        # Bucket issues by severity once; every formatter needs these
+        buckets = self.bucket_issues(issues)
         if output_format == "json":
-            return self.generate_json_report(components, issues)
+            return self.generate_json_report(components, issues, buckets, execution_waves)
         elif output_format == "html":
-            return self.generate_html_report(components, issues)
+            return self.generate_html_report(components, issues, buckets)
         else:
-            return self.generate_console_report(components, issues)
-    
-    def generate_console_report(self, components: List[AgentComponent], issues: List[DependencyIssue]) -> str:
+            return self.generate_console_report(components, issues, buckets)
+
+    @staticmethod
+    def bucket_issues(issues: List[DependencyIssue]) -> Dict[str, List[DependencyIssue]]:
+        """Group issues by severity in a single pass"""
+        buckets: Dict[str, List[DependencyIssue]] = {"error": [], "warning": [], "info": []}
+        for issue in issues:
+            buckets.setdefault(issue.severity, []).append(issue)
+        return buckets
+
+    def generate_console_report(self, components: List[AgentComponent], issues: List[DependencyIssue],
+                                buckets: Dict[str, List[DependencyIssue]]) -> str:
         """Generate console-formatted report"""
         report = []
         report.append("RaeenOS Dependency Analysis Report")
         report.append("=" * 50)
         report.append("")
-        
+
         # Summary
-        error_count = len([i for i in issues if i.severity == "error"])
-        warning_count = len([i for i in issues if i.severity == "warning"])
-        
+        error_count = len(buckets["error"])
+        warning_count = len(buckets["warning"])
+
         report.append(f"Components analyzed: {len(components)}")
         report.append(f"Issues found: {len(issues)} ({error_count} errors, {warning_count} warnings)")
         report.append("")
@@ -420,7 +617,7 @@ class DependencyReporter:
             report.append("-" * 15)
             
             for severity in ["error", "warning", "info"]:
-                severity_issues = [i for i in issues if i.severity == severity]
+                severity_issues = buckets.get(severity, [])
                 if severity_issues:
                     report.append(f"\n{severity.upper()}S:")
                     for issue in severity_issues:
@@ -434,23 +631,44 @@ class DependencyReporter:
         
         return "\n".join(report)
     
-    def generate_json_report(self, components: List[AgentComponent], issues: List[DependencyIssue]) -> str:
+    def generate_json_report(self, components: List[AgentComponent], issues: List[DependencyIssue],
+                             buckets: Dict[str, List[DependencyIssue]],
+                             execution_waves: Optional[List[List[str]]] = None) -> str:
         """Generate JSON-formatted report"""
+        report_data = self.build_json_report_data(components, issues, buckets, execution_waves)
+        return json.dumps(report_data, indent=2)
+
+    def generate_json_report_to_stream(self, components: List[AgentComponent],
+                                       issues: List[DependencyIssue], fp,
+                                       execution_waves: Optional[List[List[str]]] = None):
+        """Serialize the JSON report directly to a file object.
+
+        Avoids materializing the full serialized string in memory when the
+        report is going to a file anyway.
+        """
+        buckets = self.bucket_issues(issues)
+        json.dump(self.build_json_report_data(components, issues, buckets, execution_waves),
+                  fp, indent=2)
+
+    def build_json_report_data(self, components: List[AgentComponent], issues: List[DependencyIssue],
+                               buckets: Dict[str, List[DependencyIssue]],
+                               execution_waves: Optional[List[List[str]]] = None) -> Dict:
+        """Build the JSON report structure"""
         report_data = {
             "timestamp": "2025-07-30T12:00:00Z",  # Would be current timestamp
             "summary": {
                 "components_analyzed": len(components),
                 "total_issues": len(issues),
-                "errors": len([i for i in issues if i.severity == "error"]),
-                "warnings": len([i for i in issues if i.severity == "warning"])
+                "errors": len(buckets["error"]),
+                "warnings": len(buckets["warning"])
             },
             "components": [
                 {
                     "name": comp.name,
                     "agent_type": comp.agent_type,
                     "file_count": len(comp.file_paths),
-                    "interfaces_provided": comp.interfaces_provided,
-                    "interfaces_required": comp.interfaces_required
+                    "interfaces_provided": sorted(comp.interfaces_provided),
+                    "interfaces_required": sorted(comp.interfaces_required)
                 }
                 for comp in components
             ],
@@ -466,13 +684,18 @@ class DependencyReporter:
                 for issue in issues
             ]
         }
-        
-        return json.dumps(report_data, indent=2)
+
+        if execution_waves is not None:
+            # Build scripts can launch each wave's components in parallel
+            report_data["execution_waves"] = execution_waves
+
+        return report_data
     
-    def generate_html_report(self, components: List[AgentComponent], issues: List[DependencyIssue]) -> str:
+    def generate_html_report(self, components: List[AgentComponent], issues: List[DependencyIssue],
+                             buckets: Dict[str, List[DependencyIssue]]) -> str:
         """Generate HTML-formatted report"""
-        error_count = len([i for i in issues if i.severity == "error"])
-        warning_count = len([i for i in issues if i.severity == "warning"])
+        error_count = len(buckets["error"])
+        warning_count = len(buckets["warning"])
         
         return f"""
 <!DOCTYPE html>
@@ -502,10 +725,10 @@ class DependencyReporter:
     </div>
     
     <h2>Components</h2>
-    {''.join([f'<div class="component"><h4>{comp.name}</h4><p>Agent: {comp.agent_type}</p><p>Files: {len(comp.file_paths)}</p></div>' for comp in components])}
-    
+    {''.join(self.COMPONENT_TEMPLATE({'name': comp.name, 'agent_type': comp.agent_type, 'file_count': len(comp.file_paths)}) for comp in components)}
+
     <h2>Issues</h2>
-    {''.join([f'<div class="issue {issue.severity}"><strong>{issue.severity.upper()}</strong>: {issue.message}<br><small>Component: {issue.component}, Interface: {issue.interface}</small></div>' for issue in issues]) or '<p>No issues found!</p>'}
+    {''.join(self.ISSUE_TEMPLATE({'severity': issue.severity, 'severity_upper': issue.severity.upper(), 'message': issue.message, 'component': issue.component, 'interface': issue.interface}) for issue in issues) or '<p>No issues found!</p>'}
 </body>
 </html>
         """
@@ -536,8 +759,7 @@ def main():
     components = analyzer.discover_components()
     
     logger.info("Analyzing component interfaces...")
-    for i, component in enumerate(components):
-        components[i] = analyzer.analyze_component_interfaces(component)
+    components = analyzer.analyze_components(components)
     
     # Validate dependencies
     logger.info("Validating dependencies...")
@@ -551,15 +773,28 @@ def main():
         issues.extend(change_issues)
     
     # Generate report
-    report = reporter.generate_report(components, issues, args.format)
-    
-    # Output report
-    if args.output:
-        with open(args.output, 'w') as f:
-            f.write(report)
-        logger.info(f"Report written to {args.output}")
+    if args.format == 'json':
+        # Stream JSON straight to its destination instead of building the
+        # full serialized string first
+        if args.output:
+            with open(args.output, 'w') as f:
+                reporter.generate_json_report_to_stream(components, issues, f,
+                                                        validator.execution_waves)
+            logger.info(f"Report written to {args.output}")
+        else:
+            reporter.generate_json_report_to_stream(components, issues, sys.stdout,
+                                                    validator.execution_waves)
+            sys.stdout.write('\n')
     else:
-        print(report)
+        report = reporter.generate_report(components, issues, args.format)
+
+        # Output report
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(report)
+            logger.info(f"Report written to {args.output}")
+        else:
+            print(report)
     
     # Exit with error code if there are errors
     error_count = len([i for i in issues if i.severity == "error"])
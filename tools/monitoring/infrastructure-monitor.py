@@ -4,18 +4,35 @@ RaeenOS Infrastructure Monitoring System
 Monitors CI/CD infrastructure health, performance, and alerts on issues
 """
 
+import asyncio
+import atexit
 import json
+import math
+import operator
 import time
+import aiohttp
+import orjson
 import requests
 import subprocess
 import logging
 import os
+import string
 import sys
+import tempfile
 from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+from collections import deque, namedtuple
+from typing import Deque, Dict, List, Optional, Any
 import yaml
 
+# Prefer the libyaml C loader; configs parse an order of magnitude faster,
+# which is visible on short-lived --once and --dashboard invocations
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +44,180 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Transient HTTP statuses worth retrying with backoff
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+STATUS_COLORS = {
+    'healthy': '#28a745',
+    'warning': '#ffc107',
+    'degraded': '#fd7e14',
+    'critical': '#dc3545',
+    'unhealthy': '#dc3545'
+}
+
+# Lower value = worse; used to pick the worst component status
+STATUS_PRIORITY = {'critical': 0, 'unhealthy': 1, 'degraded': 2, 'warning': 3, 'healthy': 4}
+
+# Parsed once at import; per-cycle rendering only substitutes the dynamic
+# fields instead of rebuilding the whole document
+DASHBOARD_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>RaeenOS Infrastructure Dashboard</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 20px; background: #f8f9fa; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header { text-align: center; margin-bottom: 30px; }
+        .status-badge { display: inline-block; padding: 8px 16px; border-radius: 20px; color: white; font-weight: bold; }
+        .metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }
+        .metric-card { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .metric-value { font-size: 2em; font-weight: bold; color: #495057; }
+        .metric-label { color: #6c757d; margin-top: 5px; }
+        .alert-section { margin-top: 30px; padding: 20px; background: white; border-radius: 8px; }
+        .alert-item { padding: 10px; margin: 5px 0; border-left: 4px solid #dc3545; background: #f8f9fa; }
+        .timestamp { text-align: center; color: #6c757d; margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>RaeenOS Infrastructure Dashboard</h1>
+            <div class="status-badge" style="background-color: ${overall_color};">
+                Overall Status: ${overall_status}
+            </div>
+        </div>
+
+        <div class="metrics-grid">
+            <div class="metric-card">
+                <div class="metric-value">${build_queue_length}</div>
+                <div class="metric-label">Build Queue Length</div>
+            </div>
+
+            <div class="metric-card">
+                <div class="metric-value">${test_success_rate}%</div>
+                <div class="metric-label">Test Success Rate (24h)</div>
+            </div>
+
+            <div class="metric-card">
+                <div class="metric-value">${artifact_storage_usage}%</div>
+                <div class="metric-label">Artifact Storage Usage</div>
+            </div>
+
+            <div class="metric-card">
+                <div class="metric-value" style="color: ${github_actions_color}">${github_actions_status}</div>
+                <div class="metric-label">GitHub Actions Status</div>
+            </div>
+
+            <div class="metric-card">
+                <div class="metric-value" style="color: ${registry_color}">${registry_status}</div>
+                <div class="metric-label">Container Registry Status</div>
+            </div>
+
+            <div class="metric-card">
+                <div class="metric-value">${alerts_active}</div>
+                <div class="metric-label">Active Alerts</div>
+            </div>
+        </div>
+
+        <div class="alert-section">
+            <h3>Active Alerts</h3>
+            ${alerts_html}
+        </div>
+
+        <div class="timestamp">
+            Last updated: ${last_updated}
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+async def request_with_retry(session: aiohttp.ClientSession, method: str, url: str,
+                             retries: int = 5, backoff_factor: float = 0.5,
+                             **kwargs) -> aiohttp.ClientResponse:
+    """Issue a request, retrying 429/5xx with exponential backoff.
+
+    Honors Retry-After when the server provides it. The returned response
+    still needs to be released/closed by the caller (use async with).
+    """
+    for attempt in range(retries):
+        try:
+            response = await session.request(method, url, **kwargs)
+        except aiohttp.ClientError:
+            if attempt == retries - 1:
+                raise
+            await asyncio.sleep(backoff_factor * (2 ** attempt))
+            continue
+
+        if response.status in RETRYABLE_STATUSES and attempt < retries - 1:
+            retry_after = response.headers.get('Retry-After')
+            delay = float(retry_after) if retry_after else backoff_factor * (2 ** attempt)
+            response.release()
+            await asyncio.sleep(delay)
+            continue
+
+        return response
+
+    return response
+
+class RateLimitError(Exception):
+    """Raised when the GitHub quota is exhausted until a known reset time"""
+
+    def __init__(self, reset_at: int):
+        super().__init__(f"GitHub rate limit exhausted until {reset_at}")
+        self.reset_at = reset_at
+
+class GitHubRateLimiter:
+    """Schedule GitHub API calls below the REST quota.
+
+    A semaphore bounds in-flight requests so a gather can't burst through
+    the 5000/hr budget, and a gate closes whenever the remaining quota
+    drops under the safety margin. While the gate is closed, acquiring the
+    limiter raises RateLimitError so callers can back off until reset
+    instead of burning retries on 429s.
+    """
+
+    def __init__(self, max_concurrent: int = 8, safety_margin: int = 50):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._open = asyncio.Event()
+        self._open.set()
+        self.safety_margin = safety_margin
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[int] = None
+
+    def update(self, headers) -> None:
+        """Record X-RateLimit headers from a response and adjust the gate"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        self.remaining = int(remaining)
+        reset = headers.get('X-RateLimit-Reset')
+        if reset is not None:
+            self.reset_at = int(reset)
+
+        if self.remaining <= self.safety_margin:
+            if self._open.is_set():
+                logger.warning(f"GitHub rate limit low: {self.remaining} requests "
+                               f"remaining until {self.reset_at}")
+            self._open.clear()
+        else:
+            self._open.set()
+
+    async def __aenter__(self):
+        if not self._open.is_set():
+            if self.reset_at is not None and self.reset_at > time.time():
+                raise RateLimitError(self.reset_at)
+            # Reset time has passed; the quota is fresh again
+            self._open.set()
+        await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._semaphore.release()
+
 @dataclass
 class MetricValue:
     """Represents a metric value with timestamp"""
@@ -58,80 +249,184 @@ class InfrastructureHealth:
     alerts_active: int
     overall_status: str
 
+# Single-pass aggregate over a window of workflow runs
+RunSummary = namedtuple('RunSummary', ['queued', 'completed', 'succeeded',
+                                       'total_duration_minutes'])
+
 class GitHubActionsMonitor:
     """Monitor GitHub Actions workflow status and performance"""
     
-    def __init__(self, token: str, repo: str):
+    GRAPHQL_URL = 'https://api.github.com/graphql'
+
+    # Fetches only the four fields needed to aggregate queue length,
+    # success rate and average build time, instead of the full REST payload
+    WORKFLOW_METRICS_QUERY = """
+    query($owner: String!, $name: String!) {
+      repository(owner: $owner, name: $name) {
+        workflowRuns(first: 100) {
+          nodes { status conclusion createdAt updatedAt }
+        }
+      }
+    }
+    """
+
+    def __init__(self, token: str, repo: str, use_graphql: bool = False):
         self.token = token
         self.repo = repo
+        self.use_graphql = use_graphql
         self.headers = {
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
         }
         self.base_url = f'https://api.github.com/repos/{repo}'
-    
-    def get_workflow_runs(self, hours: int = 24) -> List[Dict]:
-        """Get recent workflow runs"""
+        # Per-cycle memo of workflow-run fetches keyed by window size; holds
+        # futures so concurrent callers share one in-flight request
+        self._runs_cache: Dict[int, asyncio.Future] = {}
+        # ETag conditional-GET cache: url -> (etag, body, last_link_url).
+        # 304 responses don't count against the GitHub rate limit
+        self._etag_cache: Dict[str, tuple] = {}
+        # Shared scheduler keeping concurrent calls below the REST quota
+        self.limiter = GitHubRateLimiter()
+
+    async def get_json(self, session: aiohttp.ClientSession, url: str,
+                       params: Optional[Dict] = None) -> tuple:
+        """Conditional GET returning (parsed body, rel=last link URL).
+
+        Sends If-None-Match when an ETag is cached; a 304 reuses the cached
+        body at zero rate-limit cost.
+        """
+        key = url if not params else f"{url}?{sorted(params.items())}"
+        cached = self._etag_cache.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+
+        async with self.limiter:
+            response = await request_with_retry(session, 'GET', url,
+                                                params=params, headers=headers)
+        async with response:
+            self.limiter.update(response.headers)
+
+            if response.status == 304 and cached:
+                return cached[1], cached[2]
+
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+            last_link = response.links.get('last')
+            last_url = str(last_link['url']) if last_link else None
+
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[key] = (etag, data, last_url)
+
+            return data, last_url
+
+    def clear_cycle_cache(self):
+        """Drop memoized workflow runs; call at the start of each cycle"""
+        self._runs_cache = {}
+
+    async def get_workflow_runs(self, session: aiohttp.ClientSession, hours: int = 24) -> List[Dict]:
+        """Get recent workflow runs (memoized per monitoring cycle)"""
+        future = self._runs_cache.get(hours)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_workflow_runs(session, hours))
+            self._runs_cache[hours] = future
+        return await asyncio.shield(future)
+
+    async def _fetch_workflow_runs(self, session: aiohttp.ClientSession, hours: int) -> List[Dict]:
+        """Fetch all workflow runs in the window, following Link pagination.
+
+        Without this, counts and success rates silently saturate at the
+        first 100 runs. The first response's rel="last" link reveals the
+        page count, so pages 2..N are fetched concurrently.
+        """
         since = (datetime.utcnow() - timedelta(hours=hours)).isoformat() + 'Z'
-        
+
         url = f'{self.base_url}/actions/runs'
         params = {
             'per_page': 100,
             'created': f'>={since}'
         }
-        
+
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json().get('workflow_runs', [])
+            data, last_url = await self.get_json(session, url, params)
+            runs = data.get('workflow_runs', [])
+
+            if last_url:
+                last_page = int(parse_qs(urlsplit(last_url).query)['page'][0])
+                if last_page > 1:
+                    pages = await asyncio.gather(*(
+                        self._fetch_runs_page(session, url, dict(params, page=page))
+                        for page in range(2, last_page + 1)
+                    ))
+                    for page_runs in pages:
+                        runs.extend(page_runs)
+
+            return runs
+        except RateLimitError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get workflow runs: {e}")
             return []
-    
-    def get_queue_length(self) -> int:
+
+    async def _fetch_runs_page(self, session: aiohttp.ClientSession, url: str, params: Dict) -> List[Dict]:
+        """Fetch a single page of workflow runs"""
+        data, _ = await self.get_json(session, url, params)
+        return data.get('workflow_runs', [])
+
+    @staticmethod
+    def _summarize(runs: List[Dict]) -> 'RunSummary':
+        """Tally queue, completion and duration stats in one pass over runs"""
+        queued = completed = succeeded = 0
+        total_duration = 0.0
+        for run in runs:
+            status = run['status']
+            if status in ('queued', 'in_progress'):
+                queued += 1
+            elif status == 'completed':
+                completed += 1
+                if run['conclusion'] == 'success':
+                    succeeded += 1
+                # fromisoformat accepts the trailing Z directly on Python
+                # 3.11+, avoiding two temp strings per run
+                created = datetime.fromisoformat(run['created_at'])
+                updated = datetime.fromisoformat(run['updated_at'])
+                total_duration += (updated - created).total_seconds() / 60
+        return RunSummary(queued, completed, succeeded, total_duration)
+
+    async def get_queue_length(self, session: aiohttp.ClientSession) -> int:
         """Get current build queue length"""
-        runs = self.get_workflow_runs(hours=1)
-        queued_runs = [run for run in runs if run['status'] in ['queued', 'in_progress']]
-        return len(queued_runs)
-    
-    def get_success_rate(self, hours: int = 24) -> float:
+        runs = await self.get_workflow_runs(session, hours=1)
+        return self._summarize(runs).queued
+
+    async def get_success_rate(self, session: aiohttp.ClientSession, hours: int = 24) -> float:
         """Get test success rate over specified period"""
-        runs = self.get_workflow_runs(hours=hours)
-        
-        if not runs:
+        runs = await self.get_workflow_runs(session, hours=hours)
+        summary = self._summarize(runs)
+        if not summary.completed:
             return 0.0
-        
-        completed_runs = [run for run in runs if run['status'] == 'completed']
-        if not completed_runs:
-            return 0.0
-        
-        successful_runs = [run for run in completed_runs if run['conclusion'] == 'success']
-        return (len(successful_runs) / len(completed_runs)) * 100.0
-    
-    def get_average_build_time(self, hours: int = 24) -> float:
+        return (summary.succeeded / summary.completed) * 100.0
+
+    async def get_average_build_time(self, session: aiohttp.ClientSession, hours: int = 24) -> float:
         """Get average build time in minutes"""
-        runs = self.get_workflow_runs(hours=hours)
-        completed_runs = [run for run in runs if run['status'] == 'completed']
-        
-        if not completed_runs:
+        runs = await self.get_workflow_runs(session, hours=hours)
+        summary = self._summarize(runs)
+        if not summary.completed:
             return 0.0
-        
-        total_duration = 0
-        for run in completed_runs:
-            created = datetime.fromisoformat(run['created_at'].replace('Z', '+00:00'))
-            updated = datetime.fromisoformat(run['updated_at'].replace('Z', '+00:00'))
-            duration = (updated - created).total_seconds() / 60  # Convert to minutes
-            total_duration += duration
-        
-        return total_duration / len(completed_runs)
-    
-    def get_runner_capacity(self) -> Dict[str, Any]:
+        return summary.total_duration_minutes / summary.completed
+
+    async def get_runner_capacity(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
         """Get GitHub Actions runner capacity information"""
         # This would typically query GitHub Enterprise API for runner info
         # For GitHub.com, we'll estimate based on queue length and recent performance
-        queue_length = self.get_queue_length()
-        avg_build_time = self.get_average_build_time(hours=1)
-        
+        queue_length, avg_build_time = await asyncio.gather(
+            self.get_queue_length(session),
+            self.get_average_build_time(session, hours=1)
+        )
+
+        return self._runner_capacity_from(queue_length, avg_build_time)
+
+    @staticmethod
+    def _runner_capacity_from(queue_length: int, avg_build_time: float) -> Dict[str, Any]:
+        """Derive runner capacity estimates from queue length and build time"""
         return {
             'queue_length': queue_length,
             'estimated_wait_time_minutes': queue_length * (avg_build_time / 5),  # Assuming 5 parallel runners
@@ -139,30 +434,79 @@ class GitHubActionsMonitor:
             'status': 'healthy' if queue_length < 10 else 'degraded' if queue_length < 20 else 'critical'
         }
 
+    async def get_workflow_metrics_graphql(self, session: aiohttp.ClientSession) -> Optional[Dict[str, Any]]:
+        """Aggregate workflow metrics from one GraphQL query.
+
+        Returns queue length, success rate and average build time computed in
+        a single pass over the compact node list, or None when the query is
+        unavailable (GraphQL coverage of Actions data varies) so callers can
+        fall back to the REST path.
+        """
+        owner, _, name = self.repo.partition('/')
+        payload = {
+            'query': self.WORKFLOW_METRICS_QUERY,
+            'variables': {'owner': owner, 'name': name}
+        }
+
+        try:
+            async with self.limiter:
+                response = await request_with_retry(session, 'POST', self.GRAPHQL_URL, json=payload)
+            async with response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+
+            if data.get('errors'):
+                logger.debug(f"GraphQL workflow metrics unavailable: {data['errors'][0].get('message')}")
+                return None
+
+            nodes = data['data']['repository']['workflowRuns']['nodes']
+        except Exception as e:
+            logger.debug(f"GraphQL workflow metrics failed: {e}")
+            return None
+
+        queued = completed = succeeded = 0
+        total_duration = 0.0
+        for node in nodes:
+            status = node['status'].lower()
+            if status in ('queued', 'in_progress'):
+                queued += 1
+            elif status == 'completed':
+                completed += 1
+                if (node.get('conclusion') or '').lower() == 'success':
+                    succeeded += 1
+                created = datetime.fromisoformat(node['createdAt'])
+                updated = datetime.fromisoformat(node['updatedAt'])
+                total_duration += (updated - created).total_seconds() / 60
+
+        return {
+            'queue_length': queued,
+            'success_rate': (succeeded / completed * 100.0) if completed else 0.0,
+            'average_build_time_minutes': (total_duration / completed) if completed else 0.0
+        }
+
 class ArtifactStorageMonitor:
     """Monitor artifact storage usage and performance"""
     
     def __init__(self, github_monitor: GitHubActionsMonitor):
         self.github_monitor = github_monitor
     
-    def get_storage_usage(self) -> Dict[str, Any]:
+    async def get_storage_usage(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
         """Get artifact storage usage statistics"""
         try:
-            # Get repository storage info
+            # Get repository storage info and artifacts concurrently
             url = f'{self.github_monitor.base_url}'
-            response = requests.get(url, headers=self.github_monitor.headers)
-            response.raise_for_status()
-            repo_data = response.json()
-            
+            artifacts_url = f'{self.github_monitor.base_url}/actions/artifacts'
+
+            async def fetch_json(target_url):
+                data, _ = await self.github_monitor.get_json(session, target_url)
+                return data
+
+            repo_data, artifacts_data = await asyncio.gather(
+                fetch_json(url), fetch_json(artifacts_url))
+
             # Calculate artifact storage (rough estimate)
             total_size_kb = repo_data.get('size', 0)
             
-            # Get artifacts from recent runs
-            artifacts_url = f'{self.github_monitor.base_url}/actions/artifacts'
-            artifacts_response = requests.get(artifacts_url, headers=self.github_monitor.headers)
-            artifacts_response.raise_for_status()
-            artifacts_data = artifacts_response.json()
-            
             total_artifacts = artifacts_data.get('total_count', 0)
             artifacts = artifacts_data.get('artifacts', [])
             
@@ -174,6 +518,8 @@ class ArtifactStorageMonitor:
                 'usage_percentage': min(100, (total_artifact_size / (10 * 1024 * 1024 * 1024)) * 100),  # Assume 10GB limit
                 'status': 'healthy' if total_artifact_size < 8 * 1024 * 1024 * 1024 else 'warning'
             }
+        except RateLimitError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get storage usage: {e}")
             return {
@@ -189,12 +535,13 @@ class ContainerRegistryMonitor:
     def __init__(self, registry_url: str = "ghcr.io"):
         self.registry_url = registry_url
     
-    def check_registry_health(self) -> Dict[str, Any]:
+    async def check_registry_health(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
         """Check container registry health"""
         try:
             # Simple health check by trying to connect
-            response = requests.get(f'https://{self.registry_url}', timeout=10)
-            status = 'healthy' if response.status_code < 500 else 'degraded'
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with session.get(f'https://{self.registry_url}', timeout=timeout) as response:
+                status = 'healthy' if response.status < 500 else 'degraded'
         except Exception as e:
             logger.error(f"Registry health check failed: {e}")
             status = 'unhealthy'
@@ -208,22 +555,70 @@ class ContainerRegistryMonitor:
 class AlertManager:
     """Manage alerts and notifications"""
     
+    # Comparison dispatch shared by every threshold check
+    _OPS = {'gt': operator.gt, 'lt': operator.lt, 'eq': operator.eq, 'ne': operator.ne}
+
+    ALERT_LOG_PATH = '/var/log/raeenos-alerts.log'
+
+    # Constant parts of the Slack payload, built once instead of per alert
+    _COLOR = {'critical': '#FF0000', 'warning': '#FFA500', 'info': '#00FF00'}
+    _ATTACHMENT_TEMPLATE = {
+        'color': '#808080',
+        'title': 'RaeenOS Infrastructure Alert',
+        'text': '',
+        'ts': 0
+    }
+
     def __init__(self, config_file: str = 'alert-config.yaml'):
         self.alerts: List[AlertConfig] = []
         self.active_alerts: Dict[str, AlertConfig] = {}
+        # metric name -> alert configs, so check_metric doesn't scan every alert
+        self._by_metric: Dict[str, List[AlertConfig]] = {}
+        # One unbuffered handle for the alert log instead of open/close per
+        # entry; opened lazily so a missing /var/log only logs once. Entries
+        # accumulate as bytes fragments and go out in one writev per batch
+        self._alert_log_fp = None
+        self._alert_log_frags: List[bytes] = []
+        atexit.register(self._close_alert_log)
+        # In-flight notification tasks; the monitoring loop awaits these
+        # between ticks so webhook latency never delays collection
+        self.notify_tasks: set = set()
+        # Reused session keeps the webhook connection alive across alerts
+        self._slack_session = requests.Session()
         self.load_config(config_file)
+
+    def _close_alert_log(self):
+        """Flush pending entries and close the alert log handle"""
+        self._flush_alert_log()
+        if self._alert_log_fp is not None:
+            try:
+                self._alert_log_fp.close()
+            except Exception:
+                pass
+            self._alert_log_fp = None
+
+    def _flush_alert_log(self):
+        """Write accumulated log fragments in a single writev syscall"""
+        if not self._alert_log_frags or self._alert_log_fp is None:
+            return
+        try:
+            os.writev(self._alert_log_fp.fileno(), self._alert_log_frags)
+        except Exception as e:
+            logger.error(f"Failed to flush alert log: {e}")
+        self._alert_log_frags.clear()
     
     def load_config(self, config_file: str):
         """Load alert configuration from file"""
         try:
             if os.path.exists(config_file):
                 with open(config_file, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=YamlSafeLoader)
                     
                 for alert_config in config.get('alerts', []):
                     alert = AlertConfig(**alert_config)
                     self.alerts.append(alert)
-                    
+                    self._by_metric.setdefault(alert.metric_name, []).append(alert)
+
                 logger.info(f"Loaded {len(self.alerts)} alert configurations")
             else:
                 # Create default configuration
@@ -268,28 +663,18 @@ class AlertManager:
     
     def check_metric(self, metric_name: str, value: float):
         """Check metric against alert thresholds"""
-        for alert in self.alerts:
-            if alert.metric_name != metric_name:
-                continue
-            
+        for alert in self._by_metric.get(metric_name, ()):
             # Check if alert is in cooldown
             if (alert.last_alert_time and 
                 datetime.utcnow() - alert.last_alert_time < timedelta(minutes=alert.cooldown_minutes)):
                 continue
-            
+
             # Check threshold
-            triggered = False
-            if alert.comparison == 'gt' and value > alert.threshold_value:
-                triggered = True
-            elif alert.comparison == 'lt' and value < alert.threshold_value:
-                triggered = True
-            elif alert.comparison == 'eq' and value == alert.threshold_value:
-                triggered = True
-            elif alert.comparison == 'ne' and value != alert.threshold_value:
-                triggered = True
-            
-            if triggered:
+            if self._OPS[alert.comparison](value, alert.threshold_value):
                 self.trigger_alert(alert, value)
+
+        # One batched write per checked metric even if several alerts fired
+        self._flush_alert_log()
     
     def trigger_alert(self, alert: AlertConfig, current_value: float):
         """Trigger an alert"""
@@ -314,29 +699,42 @@ class AlertManager:
         self.log_alert(alert, current_value, message)
     
     def send_slack_notification(self, message: str, severity: str):
-        """Send Slack notification"""
+        """Send Slack notification.
+
+        When called from inside the event loop, the blocking webhook post
+        is offloaded to a background task so it never gates the next
+        collection cycle; the monitor awaits outstanding tasks between
+        ticks.
+        """
         webhook_url = os.getenv('SLACK_WEBHOOK_URL')
         if not webhook_url:
             logger.debug("Slack webhook URL not configured")
             return
-        
-        color = {
-            'critical': '#FF0000',
-            'warning': '#FFA500',
-            'info': '#00FF00'
-        }.get(severity, '#808080')
-        
-        payload = {
-            'attachments': [{
-                'color': color,
-                'title': 'RaeenOS Infrastructure Alert',
-                'text': message,
-                'ts': int(time.time())
-            }]
-        }
-        
+
+        # Shallow-copy the prebuilt attachment and splice in the dynamic
+        # fields; the copy keeps concurrent webhook tasks from sharing a dict
+        attachment = dict(self._ATTACHMENT_TEMPLATE)
+        attachment['color'] = self._COLOR.get(severity, '#808080')
+        attachment['text'] = message
+        attachment['ts'] = int(time.time())
+        payload = {'attachments': [attachment]}
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            task = loop.create_task(asyncio.to_thread(self._post_slack, webhook_url, payload))
+            self.notify_tasks.add(task)
+            task.add_done_callback(self.notify_tasks.discard)
+        else:
+            self._post_slack(webhook_url, payload)
+
+    def _post_slack(self, webhook_url: str, payload: Dict[str, Any]):
+        """Post an alert payload to the Slack webhook (blocking)"""
         try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
+            response = self._slack_session.post(webhook_url, json=payload, timeout=10)
             response.raise_for_status()
             logger.info("Slack notification sent successfully")
         except Exception as e:
@@ -355,8 +753,11 @@ class AlertManager:
         }
         
         try:
-            with open('/var/log/raeenos-alerts.log', 'a') as f:
-                f.write(json.dumps(alert_entry) + '\n')
+            if self._alert_log_fp is None:
+                # Unbuffered: writev pushes the batch straight to the kernel
+                # without copying through a Python-level buffer
+                self._alert_log_fp = open(self.ALERT_LOG_PATH, 'ab', buffering=0)
+            self._alert_log_frags.append(orjson.dumps(alert_entry) + b'\n')
         except Exception as e:
             logger.error(f"Failed to log alert: {e}")
     
@@ -375,14 +776,32 @@ class InfrastructureMonitor:
         # Initialize monitors
         self.github_monitor = GitHubActionsMonitor(
             self.config['github']['token'],
-            self.config['github']['repository']
+            self.config['github']['repository'],
+            use_graphql=self.config['github'].get('use_graphql', False)
         )
         self.storage_monitor = ArtifactStorageMonitor(self.github_monitor)
         self.registry_monitor = ContainerRegistryMonitor()
         self.alert_manager = AlertManager()
         
-        # Metrics storage
-        self.metrics: Dict[str, List[MetricValue]] = {}
+        # Metrics storage: bounded deques sized to the retention window,
+        # so inserts are O(1) and retention needs no per-insert rebuild
+        monitoring = self.config['monitoring']
+        self._metric_maxlen = max(1, math.ceil(
+            monitoring['retention_hours'] * 3600 / monitoring['interval_seconds']))
+        self.metrics: Dict[str, Deque[MetricValue]] = {}
+
+        # Last health snapshot, reused for requests arriving within one
+        # polling interval so back-to-back dashboard refreshes don't repeat
+        # the full API storm
+        self._last_health: Optional[InfrastructureHealth] = None
+        self._last_collected_at: Optional[datetime] = None
+        # Hash of the last rendered snapshot so quiet cycles skip the
+        # dashboard render and write
+        self._last_dashboard_hash: Optional[int] = None
+
+        # Background tasks spawned by the cycle (dashboard writes); awaited
+        # between ticks so they never block collection
+        self._background_tasks: set = set()
         
         logger.info("Infrastructure monitor initialized")
     
@@ -405,7 +824,7 @@ class InfrastructureMonitor:
         try:
             if os.path.exists(config_file):
                 with open(config_file, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=YamlSafeLoader)
                     # Merge with defaults
                     for key, value in default_config.items():
                         if key not in config:
@@ -420,21 +839,60 @@ class InfrastructureMonitor:
             logger.error(f"Failed to load config, using defaults: {e}")
             return default_config
     
-    def collect_metrics(self) -> InfrastructureHealth:
+    def collect_metrics(self, force: bool = False) -> InfrastructureHealth:
         """Collect all infrastructure metrics"""
+        return asyncio.run(self.collect_metrics_async(force=force))
+
+    async def collect_metrics_async(self, force: bool = False) -> InfrastructureHealth:
+        """Collect all infrastructure metrics concurrently.
+
+        All HTTP round trips are awaited together, so cycle latency is
+        bounded by the slowest request rather than the sum of them. Results
+        are cached for one polling interval; pass force=True to refresh.
+        """
+        if not force and self._last_health is not None:
+            age = (datetime.utcnow() - self._last_collected_at).total_seconds()
+            if age < self.config['monitoring']['interval_seconds']:
+                logger.debug("Returning cached metrics (%.0fs old)", age)
+                return self._last_health
+
         logger.info("Collecting infrastructure metrics...")
-        
-        # GitHub Actions metrics
-        queue_length = self.github_monitor.get_queue_length()
-        success_rate = self.github_monitor.get_success_rate()
-        runner_capacity = self.github_monitor.get_runner_capacity()
-        
-        # Storage metrics
-        storage_info = self.storage_monitor.get_storage_usage()
-        
-        # Registry metrics
-        registry_health = self.registry_monitor.check_registry_health()
-        
+
+        # Fresh memo each cycle so the shared workflow-runs fetches are
+        # reused within the cycle but never go stale across cycles
+        self.github_monitor.clear_cycle_cache()
+
+        # One authenticated session per cycle for GitHub, and a bare one for
+        # the registry check so the token is never sent elsewhere
+        # Bound the connection pool so paginated fan-out reuses keep-alive
+        # sockets instead of opening one TLS connection per request
+        connector = aiohttp.TCPConnector(limit=16)
+        async with aiohttp.ClientSession(headers=self.github_monitor.headers,
+                                         connector=connector) as gh_session, \
+                aiohttp.ClientSession() as plain_session:
+            graphql_metrics = None
+            if self.github_monitor.use_graphql:
+                graphql_metrics = await self.github_monitor.get_workflow_metrics_graphql(gh_session)
+
+            if graphql_metrics is not None:
+                queue_length = graphql_metrics['queue_length']
+                success_rate = graphql_metrics['success_rate']
+                runner_capacity = self.github_monitor._runner_capacity_from(
+                    queue_length, graphql_metrics['average_build_time_minutes'])
+                storage_info, registry_health = await asyncio.gather(
+                    self.storage_monitor.get_storage_usage(gh_session),
+                    self.registry_monitor.check_registry_health(plain_session)
+                )
+            else:
+                (queue_length, success_rate, runner_capacity,
+                 storage_info, registry_health) = await asyncio.gather(
+                    self.github_monitor.get_queue_length(gh_session),
+                    self.github_monitor.get_success_rate(gh_session),
+                    self.github_monitor.get_runner_capacity(gh_session),
+                    self.storage_monitor.get_storage_usage(gh_session),
+                    self.registry_monitor.check_registry_health(plain_session)
+                )
+
         # Store metrics
         timestamp = datetime.utcnow()
         self.store_metric('build_queue_length', queue_length, timestamp)
@@ -449,10 +907,10 @@ class InfrastructureMonitor:
         
         # Determine overall status
         overall_status = self.calculate_overall_status(
+            success_rate,
             runner_capacity['status'],
             storage_info['status'],
-            registry_health['status'],
-            success_rate
+            registry_health['status']
         )
         
         # Create health snapshot
@@ -468,179 +926,189 @@ class InfrastructureMonitor:
             overall_status=overall_status
         )
         
+        self._last_health = health
+        self._last_collected_at = timestamp
+
         logger.info(f"Metrics collected - Status: {overall_status}, Queue: {queue_length}, Success Rate: {success_rate:.1f}%")
         return health
     
     def store_metric(self, name: str, value: float, timestamp: datetime, unit: str = ""):
         """Store a metric value"""
-        if name not in self.metrics:
-            self.metrics[name] = []
-        
-        metric = MetricValue(value=value, timestamp=timestamp, unit=unit)
-        self.metrics[name].append(metric)
-        
-        # Clean old metrics
+        series = self.metrics.get(name)
+        if series is None:
+            series = self.metrics[name] = deque(maxlen=self._metric_maxlen)
+
+        # maxlen bounds memory; old samples fall off the left end. When
+        # cycles run slower than the configured interval, maxlen alone
+        # would keep samples past the retention window, so also pop
+        # expired entries — series are time-ordered, so this stops at the
+        # first live sample and only touches the k expired ones
+        series.append(MetricValue(value=value, timestamp=timestamp, unit=unit))
         cutoff = timestamp - timedelta(hours=self.config['monitoring']['retention_hours'])
-        self.metrics[name] = [m for m in self.metrics[name] if m.timestamp > cutoff]
+        while series and series[0].timestamp < cutoff:
+            series.popleft()
     
-    def calculate_overall_status(self, *statuses) -> str:
-        """Calculate overall infrastructure status"""
-        status_priority = {'critical': 0, 'unhealthy': 1, 'degraded': 2, 'warning': 3, 'healthy': 4}
-        
-        # Special handling for success rate
-        success_rate = None
-        filtered_statuses = []
-        for status in statuses:
-            if isinstance(status, (int, float)):
-                success_rate = status
-            else:
-                filtered_statuses.append(status)
-        
-        # Check success rate
+    def calculate_overall_status(self, success_rate: Optional[float], *statuses: str) -> str:
+        """Calculate overall infrastructure status from component statuses.
+
+        The success rate is an explicit parameter rather than sniffed out
+        of *statuses by type, and the worst status is picked through the
+        module-level STATUS_PRIORITY table instead of a per-call dict and
+        lambda.
+        """
+        statuses = list(statuses)
+
+        # Fold the success rate into a status
         if success_rate is not None and success_rate < 50:
-            filtered_statuses.append('critical')
+            statuses.append('critical')
         elif success_rate is not None and success_rate < 80:
-            filtered_statuses.append('warning')
-        
-        if not filtered_statuses:
+            statuses.append('warning')
+
+        if not statuses:
             return 'healthy'
-        
+
         # Return worst status
-        worst_status = min(filtered_statuses, key=lambda s: status_priority.get(s, 999))
-        return worst_status
+        priorities = [STATUS_PRIORITY.get(s, 999) for s in statuses]
+        return statuses[priorities.index(min(priorities))]
     
-    def generate_dashboard(self, output_file: str = '/tmp/infrastructure-dashboard.html'):
-        """Generate HTML dashboard"""
+    def generate_dashboard(self, health: InfrastructureHealth,
+                           output_file: str = '/tmp/infrastructure-dashboard.html'):
+        """Generate HTML dashboard from an already-collected health snapshot"""
+        # Skip the render and file write entirely when nothing visible
+        # changed since the last cycle — the common case for healthy CI
+        snapshot_hash = hash((
+            health.build_queue_length,
+            round(health.test_success_rate, 1),
+            round(health.artifact_storage_usage, 1),
+            health.github_actions_status,
+            health.container_registry_status,
+            health.overall_status,
+            tuple(sorted(self.alert_manager.active_alerts))
+        ))
+        if snapshot_hash == self._last_dashboard_hash:
+            logger.debug("Dashboard unchanged, skipping re-render")
+            return
+
         logger.info(f"Generating infrastructure dashboard: {output_file}")
-        
-        # Collect current metrics
-        health = self.collect_metrics()
-        
+
         # Generate HTML dashboard
         html_content = self.create_dashboard_html(health)
-        
+
+        # Write to a sibling tempfile and rename so readers never observe a
+        # half-written dashboard (os.replace is atomic on POSIX)
         try:
-            with open(output_file, 'w') as f:
-                f.write(html_content)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(output_file) or '.', suffix='.html')
+            try:
+                # Encode once and write straight through the raw fd; the
+                # memoryview slices away written prefixes without copying
+                view = memoryview(html_content.encode('utf-8'))
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, output_file)
+            self._last_dashboard_hash = snapshot_hash
             logger.info(f"Dashboard generated: {output_file}")
         except Exception as e:
             logger.error(f"Failed to generate dashboard: {e}")
     
     def create_dashboard_html(self, health: InfrastructureHealth) -> str:
         """Create HTML dashboard content"""
-        status_colors = {
-            'healthy': '#28a745',
-            'warning': '#ffc107',
-            'degraded': '#fd7e14',
-            'critical': '#dc3545',
-            'unhealthy': '#dc3545'
-        }
-        
-        overall_color = status_colors.get(health.overall_status, '#6c757d')
-        
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>RaeenOS Infrastructure Dashboard</title>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 20px; background: #f8f9fa; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        .header {{ text-align: center; margin-bottom: 30px; }}
-        .status-badge {{ display: inline-block; padding: 8px 16px; border-radius: 20px; color: white; font-weight: bold; }}
-        .metrics-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }}
-        .metric-card {{ background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .metric-value {{ font-size: 2em; font-weight: bold; color: #495057; }}
-        .metric-label {{ color: #6c757d; margin-top: 5px; }}
-        .alert-section {{ margin-top: 30px; padding: 20px; background: white; border-radius: 8px; }}
-        .alert-item {{ padding: 10px; margin: 5px 0; border-left: 4px solid #dc3545; background: #f8f9fa; }}
-        .timestamp {{ text-align: center; color: #6c757d; margin-top: 20px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>RaeenOS Infrastructure Dashboard</h1>
-            <div class="status-badge" style="background-color: {overall_color};">
-                Overall Status: {health.overall_status.upper()}
-            </div>
-        </div>
-        
-        <div class="metrics-grid">
-            <div class="metric-card">
-                <div class="metric-value">{health.build_queue_length}</div>
-                <div class="metric-label">Build Queue Length</div>
-            </div>
-            
-            <div class="metric-card">
-                <div class="metric-value">{health.test_success_rate:.1f}%</div>
-                <div class="metric-label">Test Success Rate (24h)</div>
-            </div>
-            
-            <div class="metric-card">
-                <div class="metric-value">{health.artifact_storage_usage:.1f}%</div>
-                <div class="metric-label">Artifact Storage Usage</div>
-            </div>
-            
-            <div class="metric-card">
-                <div class="metric-value" style="color: {status_colors.get(health.github_actions_status, '#6c757d')}">{health.github_actions_status.upper()}</div>
-                <div class="metric-label">GitHub Actions Status</div>
-            </div>
-            
-            <div class="metric-card">
-                <div class="metric-value" style="color: {status_colors.get(health.container_registry_status, '#6c757d')}">{health.container_registry_status.upper()}</div>
-                <div class="metric-label">Container Registry Status</div>
-            </div>
-            
-            <div class="metric-card">
-                <div class="metric-value">{health.alerts_active}</div>
-                <div class="metric-label">Active Alerts</div>
-            </div>
-        </div>
-        
-        <div class="alert-section">
-            <h3>Active Alerts</h3>
-            {''.join([f'<div class="alert-item">Alert: {alert.metric_name} - {alert.severity}</div>' for alert in self.alert_manager.active_alerts.values()]) or '<p>No active alerts</p>'}
-        </div>
-        
-        <div class="timestamp">
-            Last updated: {health.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}
-        </div>
-    </div>
-</body>
-</html>
-        """
+        return DASHBOARD_TEMPLATE.substitute(
+            overall_color=STATUS_COLORS.get(health.overall_status, '#6c757d'),
+            overall_status=health.overall_status.upper(),
+            build_queue_length=health.build_queue_length,
+            test_success_rate=f'{health.test_success_rate:.1f}',
+            artifact_storage_usage=f'{health.artifact_storage_usage:.1f}',
+            github_actions_color=STATUS_COLORS.get(health.github_actions_status, '#6c757d'),
+            github_actions_status=health.github_actions_status.upper(),
+            registry_color=STATUS_COLORS.get(health.container_registry_status, '#6c757d'),
+            registry_status=health.container_registry_status.upper(),
+            alerts_active=health.alerts_active,
+            alerts_html=''.join(
+                f'<div class="alert-item">Alert: {alert.metric_name} - {alert.severity}</div>'
+                for alert in self.alert_manager.active_alerts.values()
+            ) or '<p>No active alerts</p>',
+            last_updated=health.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')
+        )
     
-    def run_monitoring_cycle(self):
-        """Run a single monitoring cycle"""
+    def _pending_tasks(self) -> set:
+        """Background tasks (dashboard write, notifications) still in flight"""
+        return self._background_tasks | self.alert_manager.notify_tasks
+
+    async def run_monitoring_cycle_async(self):
+        """Run a single monitoring cycle.
+
+        The dashboard write is launched as a background task so its file
+        I/O overlaps the tick sleep rather than extending the cycle.
+        """
         try:
-            health = self.collect_metrics()
-            
-            # Generate dashboard
-            self.generate_dashboard()
-            
+            health = await self.collect_metrics_async()
+
+            # Generate dashboard from the snapshot just collected - no
+            # second round of API calls
+            task = asyncio.create_task(asyncio.to_thread(self.generate_dashboard, health))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
             # Output health summary
-            print(json.dumps(asdict(health), default=str, indent=2))
-            
+            print(orjson.dumps(asdict(health),
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC).decode())
+
+        except RateLimitError:
+            raise
         except Exception as e:
             logger.error(f"Monitoring cycle failed: {e}")
-    
-    def run_continuous_monitoring(self):
-        """Run continuous monitoring loop"""
-        logger.info(f"Starting continuous monitoring (interval: {self.config['monitoring']['interval_seconds']}s)")
-        
+
+    def run_monitoring_cycle(self):
+        """Run a single monitoring cycle and drain background tasks"""
+        asyncio.run(self._run_cycle_and_drain())
+
+    async def _run_cycle_and_drain(self):
+        await self.run_monitoring_cycle_async()
+        pending = self._pending_tasks()
+        if pending:
+            await asyncio.wait(pending)
+
+    async def run_continuous_monitoring_async(self):
+        """Continuous monitoring loop under asyncio.
+
+        asyncio.sleep between ticks keeps the loop cancellable, and the
+        Slack/dashboard tasks spawned during a cycle are awaited with the
+        remainder of the interval as timeout so they overlap the idle time
+        instead of adding to cycle wall-clock.
+        """
+        interval = self.config['monitoring']['interval_seconds']
+        logger.info(f"Starting continuous monitoring (interval: {interval}s)")
+
         while True:
+            started = time.monotonic()
             try:
-                self.run_monitoring_cycle()
-                time.sleep(self.config['monitoring']['interval_seconds'])
-            except KeyboardInterrupt:
-                logger.info("Monitoring stopped by user")
-                break
+                await self.run_monitoring_cycle_async()
+            except RateLimitError as e:
+                delay = max(60, e.reset_at - time.time())
+                logger.warning(f"GitHub quota exhausted, backing off {delay:.0f}s until reset")
+                await asyncio.sleep(delay)
+                continue
             except Exception as e:
                 logger.error(f"Monitoring error: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                await asyncio.sleep(60)  # Wait 1 minute before retrying
+                continue
+
+            remaining = max(0.0, interval - (time.monotonic() - started))
+            pending = self._pending_tasks()
+            if pending:
+                await asyncio.wait(pending, timeout=remaining)
+                remaining = max(0.0, interval - (time.monotonic() - started))
+            await asyncio.sleep(remaining)
+
+    def run_continuous_monitoring(self):
+        """Run continuous monitoring loop"""
+        try:
+            asyncio.run(self.run_continuous_monitoring_async())
+        except KeyboardInterrupt:
+            logger.info("Monitoring stopped by user")
 
 def main():
     """Main entry point"""
@@ -657,7 +1125,7 @@ def main():
     monitor = InfrastructureMonitor(args.config)
     
     if args.dashboard:
-        monitor.generate_dashboard(args.dashboard)
+        monitor.generate_dashboard(monitor.collect_metrics(), args.dashboard)
         print(f"Dashboard generated: {args.dashboard}")
     elif args.once:
         monitor.run_monitoring_cycle()
@@ -7,21 +7,216 @@ Author: Testing & QA Automation Lead
 """
 
 import json
+import re
 import time
 import subprocess
 import sys
-import argparse
 import os
-import threading
-import queue
+import asyncio
+import functools
+import itertools
+import types
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 import yaml
 import tempfile
 import shutil
 
+# libyaml C loader when available (~5-10x faster parse), pure-Python fallback
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson serializes straight to bytes several times faster than stdlib json;
+# fall back to json where it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps_jsonl(obj: Dict[str, Any]) -> bytes:
+    """Serialize one report record as a JSON line"""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj) + '\n').encode()
+
+def _aggregate_durations(durations: List[float]) -> Dict[str, float]:
+    """Single-pass mean/std/min/max over per-case durations (seconds)"""
+    n = len(durations)
+    if not n:
+        return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0}
+    total = 0.0
+    total_sq = 0.0
+    lo = hi = durations[0]
+    for d in durations:
+        total += d
+        total_sq += d * d
+        if d < lo:
+            lo = d
+        elif d > hi:
+            hi = d
+    mean = total / n
+    variance = max(total_sq / n - mean * mean, 0.0)
+    return {"mean": mean, "std": variance ** 0.5, "min": lo, "max": hi}
+
+def _write_raw(path: str, payload: bytes) -> None:
+    """Write pre-encoded bytes straight to a raw fd.
+
+    Skips the BufferedWriter/TextIOWrapper layering; the payload is
+    already one bytes object, so buffering only adds copies.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def write_report(path: str, suite_result: Dict[str, Any],
+                 pretty: bool = True) -> None:
+    """Write a suite result dict to a JSON report file.
+
+    Indentation is only worth paying for when a human will read the
+    file; pass pretty=False (e.g. in CI) for compact output that is
+    faster to encode and ~30% smaller.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        _write_raw(path, orjson.dumps(suite_result, option=option))
+    else:
+        # iterencode avoids materializing the whole document as one
+        # string, and os.writev submits the chunks in IOV_MAX-sized
+        # batches — a handful of syscalls instead of one per chunk
+        encoder = json.JSONEncoder(indent=2 if pretty else None)
+        iov_max = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else 1024
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            batch = []
+            for chunk in encoder.iterencode(suite_result):
+                batch.append(chunk.encode())
+                if len(batch) >= iov_max:
+                    os.writev(fd, batch)
+                    batch.clear()
+            if batch:
+                os.writev(fd, batch)
+        finally:
+            os.close(fd)
+
+# Module loads/unloads are hoisted to suite-level setup and cleanup (one
+# load per unique agent per suite), so per-case commands carry only the
+# case-specific extras
+def _case_setup(p: str, s: str, *extra: str) -> List[str]:
+    """Standard per-case setup commands"""
+    return list(extra)
+
+def _case_cleanup(p: str, s: str, *prefix: str) -> List[str]:
+    """Standard per-case cleanup commands"""
+    return list(prefix)
+
+async def _handle_default(command: str) -> subprocess.CompletedProcess:
+    """Default command simulation: short delay, echo the command"""
+    await asyncio.sleep(0.1)
+    return subprocess.CompletedProcess(
+        args=[command], returncode=0, stdout=f"Command executed: {command}", stderr=""
+    )
+
+def _make_handler(delay: float, stdout: str):
+    """Build a simulated handler with a fixed delay and canned output"""
+    async def handler(command: str) -> subprocess.CompletedProcess:
+        await asyncio.sleep(delay)
+        return subprocess.CompletedProcess(
+            args=[command], returncode=0, stdout=stdout, stderr=""
+        )
+    return handler
+
+# Command verb -> simulated handler, dispatched by _execute_command
+_CMD_HANDLERS = {
+    "load_agent_module": _make_handler(0.1, "Module loaded successfully"),
+    "validate_interface_contract": _make_handler(
+        0.5, "contract_validation=pass\napi_endpoints_tested=15\ndata_structure_compatibility=100%"),
+    "test_error_handling": _make_handler(
+        0.3, "error_handling=graceful\nsystem_stability=maintained\nrecovery_time=2.3"),
+    "send_ping_requests": _make_handler(
+        1.0, "avg_latency=7.2\nmax_latency=15.8\nlatency_jitter=2.1"),
+}
+
+# key=value lines in test output, skipping the default-command echo
+_METRIC_RE = re.compile(r'^(?!Command executed)([^=\n]+?)=(.*)$', re.MULTILINE)
+_NUMERIC_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+
+# Leading numeric portion of a threshold, tolerating unit suffixes like
+# "5 seconds", "10ms" or "100 MB/s"
+_THRESHOLD_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+def _compile_predicates(expected_results: Dict[str, Any]) -> Dict[str, Any]:
+    """Compile expected-result entries into predicate callables.
+
+    Threshold strings like "> 100 MB/s" are parsed once here instead of
+    on every validation; each entry becomes a callable taking the actual
+    metric value. Predicates receive the (is_numeric, value) pairs
+    produced by _parse_test_metrics, so no isinstance checks run in the
+    hot loop.
+    """
+    predicates = {}
+    for key, expected in expected_results.items():
+        if isinstance(expected, str) and expected[:1] in ('>', '<'):
+            match = _THRESHOLD_RE.match(expected[1:].strip())
+            if match:
+                threshold = float(match.group())
+                if expected[0] == '>':
+                    predicates[key] = (lambda m, t=threshold:
+                                       m[0] and m[1] > t)
+                else:
+                    predicates[key] = (lambda m, t=threshold:
+                                       m[0] and m[1] < t)
+                continue
+        if isinstance(expected, str):
+            predicates[key] = lambda m, e=expected: str(m[1]) == e
+        else:
+            predicates[key] = lambda m, e=expected: m[1] == e
+    return predicates
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_cached(path: str, mtime: float) -> dict:
+    """Parse a YAML file, memoized on (path, mtime).
+
+    Repeated executor construction (and sibling tools importing this
+    module) reuse the parsed dict until the file actually changes.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+# Mock agent interface definitions, shared read-only across executors
+_AGENT_INTERFACES = types.MappingProxyType({
+    "kernel-architect": {
+        "provides": ["memory_management", "process_scheduling", "syscall_interface"],
+        "requires": ["hardware_abstraction"],
+        "interfaces": {
+            "memory_management": {
+                "functions": ["allocate_memory", "free_memory", "get_memory_stats"],
+                "data_structures": ["memory_block", "allocation_info"]
+            }
+        }
+    },
+    "driver-integration-specialist": {
+        "provides": ["device_management", "driver_loading"],
+        "requires": ["kernel_services"],
+        "interfaces": {
+            "device_management": {
+                "functions": ["register_device", "unregister_device", "enumerate_devices"],
+                "data_structures": ["device_info", "driver_context"]
+            }
+        }
+    }
+    # Additional agent interfaces would be defined here
+})
+
 class TestStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -30,7 +225,7 @@ class TestStatus(Enum):
     SKIPPED = "skipped"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationTestCase:
     """Represents a single integration test case"""
     test_id: str
@@ -44,11 +239,36 @@ class IntegrationTestCase:
     cleanup_commands: List[str]
     expected_results: Dict[str, Any]
     timeout_seconds: int = 300
-    
+    # Predicates compiled once from expected_results; not serialized
+    _compiled_expected: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Agent names and test types recur across thousands of cases;
+        # interning keeps one canonical str and makes dict lookups and
+        # comparisons identity-fast
+        self.primary_agent = sys.intern(self.primary_agent)
+        self.test_type = sys.intern(self.test_type)
+        self.secondary_agents = [sys.intern(a) for a in self.secondary_agents]
+        self._compiled_expected = _compile_predicates(self.expected_results)
+
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built by hand instead of dataclasses.asdict, which deep-copies
+        # every nested list/dict on each serialization
+        return {
+            "test_id": self.test_id,
+            "name": self.name,
+            "description": self.description,
+            "primary_agent": self.primary_agent,
+            "secondary_agents": list(self.secondary_agents),
+            "test_type": self.test_type,
+            "setup_commands": list(self.setup_commands),
+            "test_commands": list(self.test_commands),
+            "cleanup_commands": list(self.cleanup_commands),
+            "expected_results": dict(self.expected_results),
+            "timeout_seconds": self.timeout_seconds
+        }
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationTestResult:
     """Result of an integration test"""
     test_case: IntegrationTestCase
@@ -61,14 +281,24 @@ class IntegrationTestResult:
     return_code: int
     metrics: Dict[str, Any]
     error_message: Optional[str] = None
-    
+
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        result['test_case'] = self.test_case.to_dict()
-        result['status'] = self.status.value
-        return result
+        # stdout/stderr go in by reference; deep-copying them through
+        # asdict doubled memory traffic for large outputs
+        return {
+            "test_case": self.test_case.to_dict(),
+            "status": self.status.value,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+            "return_code": self.return_code,
+            "metrics": self.metrics,
+            "error_message": self.error_message
+        }
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationTestSuite:
     """Collection of integration tests for agent interactions"""
     suite_id: str
@@ -78,20 +308,80 @@ class IntegrationTestSuite:
     test_cases: List[IntegrationTestCase]
     setup_commands: List[str]
     cleanup_commands: List[str]
-    
+
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        result['test_cases'] = [tc.to_dict() for tc in self.test_cases]
-        return result
+        return {
+            "suite_id": self.suite_id,
+            "name": self.name,
+            "description": self.description,
+            "primary_agent": self.primary_agent,
+            "test_cases": [tc.to_dict() for tc in self.test_cases],
+            "setup_commands": list(self.setup_commands),
+            "cleanup_commands": list(self.cleanup_commands)
+        }
 
 class IntegrationTestExecutor:
     """Executes integration tests between agents"""
-    
-    def __init__(self, project_root: str):
+
+    _BASE_SETUP_COMMANDS = (
+        "initialize_test_environment",
+        "setup_logging",
+        "create_temp_workspace"
+    )
+
+    _BASE_CLEANUP_COMMANDS = (
+        "cleanup_temp_workspace",
+        "stop_logging",
+        "cleanup_test_environment"
+    )
+
+    _AGENT_SETUP_COMMANDS = types.MappingProxyType({
+        "kernel-architect": (
+            "setup_kernel_test_environment",
+            "load_test_kernel_modules",
+            "initialize_memory_subsystem"
+        ),
+        "gaming-layer-engineer": (
+            "setup_graphics_test_environment",
+            "initialize_virtual_display",
+            "load_test_gpu_drivers"
+        ),
+        "raeen-studio-lead": (
+            "setup_ui_test_environment",
+            "initialize_test_database",
+            "start_test_services"
+        )
+    })
+
+    _AGENT_CLEANUP_COMMANDS = types.MappingProxyType({
+        "kernel-architect": (
+            "unload_test_kernel_modules",
+            "cleanup_memory_subsystem",
+            "restore_kernel_state"
+        ),
+        "gaming-layer-engineer": (
+            "unload_test_gpu_drivers",
+            "cleanup_virtual_display",
+            "restore_graphics_state"
+        ),
+        "raeen-studio-lead": (
+            "stop_test_services",
+            "cleanup_test_database",
+            "restore_ui_state"
+        )
+    })
+
+    def __init__(self, project_root: str, max_workers: Optional[int] = None,
+                 keep_raw_output: bool = False):
         self.project_root = Path(project_root)
         self.test_configs_dir = self.project_root / "tools" / "quality-gates" / "config" / "integration"
         self.test_results_dir = self.project_root / "tools" / "quality-gates" / "reports" / "integration"
-        self.temp_dir = None
+        # Test cases are I/O-bound (subprocess waits), so oversubscribe
+        # relative to core count
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        # Raw command output is only retained on request; metrics are
+        # parsed incrementally so results stay small by default
+        self.keep_raw_output = keep_raw_output
         
         # Ensure directories exist
         self.test_results_dir.mkdir(parents=True, exist_ok=True)
@@ -104,41 +394,17 @@ class IntegrationTestExecutor:
     
     def _load_agent_interfaces(self) -> Dict[str, Any]:
         """Load agent interface definitions"""
-        interfaces_file = self.project_root / "docs" / "INTERFACE_INTEGRATION_GUIDE.md"
-        
-        # In a real implementation, this would parse the interface definitions
-        # For now, we'll return a mock structure
-        return {
-            "kernel-architect": {
-                "provides": ["memory_management", "process_scheduling", "syscall_interface"],
-                "requires": ["hardware_abstraction"],
-                "interfaces": {
-                    "memory_management": {
-                        "functions": ["allocate_memory", "free_memory", "get_memory_stats"],
-                        "data_structures": ["memory_block", "allocation_info"]
-                    }
-                }
-            },
-            "driver-integration-specialist": {
-                "provides": ["device_management", "driver_loading"],
-                "requires": ["kernel_services"],
-                "interfaces": {
-                    "device_management": {
-                        "functions": ["register_device", "unregister_device", "enumerate_devices"],
-                        "data_structures": ["device_info", "driver_context"]
-                    }
-                }
-            }
-            # Additional agent interfaces would be defined here
-        }
+        # In a real implementation, this would parse
+        # docs/INTERFACE_INTEGRATION_GUIDE.md; the mock structure is a
+        # shared module-level constant so construction allocates nothing
+        return _AGENT_INTERFACES
     
     def _load_integration_matrix(self) -> Dict[str, List[str]]:
         """Load integration dependency matrix"""
         matrix_file = self.test_configs_dir / "integration_matrix.yml"
         
         if matrix_file.exists():
-            with open(matrix_file, 'r') as f:
-                return yaml.safe_load(f)
+            return _parse_yaml_cached(str(matrix_file), matrix_file.stat().st_mtime)
         
         # Default integration matrix
         return {
@@ -167,14 +433,22 @@ class IntegrationTestExecutor:
                 cleanup_commands=[]
             )
         
-        test_cases = []
-        
-        # Generate interface validation tests
-        for secondary_agent in related_agents:
-            test_cases.extend(self._generate_interface_tests(primary_agent, secondary_agent))
-            test_cases.extend(self._generate_data_flow_tests(primary_agent, secondary_agent))
-            test_cases.extend(self._generate_performance_tests(primary_agent, secondary_agent))
-            test_cases.extend(self._generate_security_tests(primary_agent, secondary_agent))
+        # Fan out every generator over every related agent and materialize
+        # once, instead of four list.extend calls per agent
+        generators = (self._generate_interface_tests, self._generate_data_flow_tests,
+                      self._generate_performance_tests, self._generate_security_tests)
+        test_cases = list(itertools.chain.from_iterable(
+            gen(primary_agent, secondary_agent)
+            for secondary_agent in related_agents
+            for gen in generators))
+
+        # Load every agent once at suite level instead of per test case;
+        # repeated per-case load/unload was the dominant latency component
+        unique_agents = sorted({primary_agent, *related_agents})
+        suite_setup = (self._get_setup_commands(primary_agent)
+                       + [f"load_agent_module {agent}" for agent in unique_agents])
+        suite_cleanup = ([f"unload_agent_module {agent}" for agent in unique_agents]
+                         + self._get_cleanup_commands(primary_agent))
         
         return IntegrationTestSuite(
             suite_id=f"{primary_agent}_integration",
@@ -182,8 +456,8 @@ class IntegrationTestExecutor:
             description=f"Integration tests for {primary_agent} with {len(related_agents)} related agents",
             primary_agent=primary_agent,
             test_cases=test_cases,
-            setup_commands=self._get_setup_commands(primary_agent),
-            cleanup_commands=self._get_cleanup_commands(primary_agent)
+            setup_commands=suite_setup,
+            cleanup_commands=suite_cleanup
         )
     
     def _generate_interface_tests(self, primary_agent: str, secondary_agent: str) -> List[IntegrationTestCase]:
@@ -199,21 +473,15 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="interface",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "initialize_test_environment"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "initialize_test_environment"),
             test_commands=[
                 f"validate_interface_contract {primary_agent} {secondary_agent}",
                 f"test_api_endpoints {primary_agent} {secondary_agent}",
                 f"verify_data_structures {primary_agent} {secondary_agent}"
             ],
-            cleanup_commands=[
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}",
-                "cleanup_test_environment"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent)
+                             + ["cleanup_test_environment"],
             expected_results={
                 "contract_validation": "pass",
                 "api_endpoints_tested": "> 0",
@@ -230,22 +498,16 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="interface",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "enable_error_injection"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "enable_error_injection"),
             test_commands=[
                 f"inject_error {secondary_agent} network_failure",
                 f"test_error_handling {primary_agent}",
                 f"inject_error {primary_agent} resource_exhaustion",
                 f"test_error_recovery {secondary_agent}"
             ],
-            cleanup_commands=[
-                "disable_error_injection",
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent,
+                                           "disable_error_injection"),
             expected_results={
                 "error_handling": "graceful",
                 "system_stability": "maintained",
@@ -269,22 +531,16 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="data_flow",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "setup_data_integrity_monitoring"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "setup_data_integrity_monitoring"),
             test_commands=[
                 "generate_test_data_with_checksum",
                 f"send_data {primary_agent} {secondary_agent}",
                 f"verify_data_integrity {secondary_agent}",
                 "validate_checksums"
             ],
-            cleanup_commands=[
-                "cleanup_test_data",
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent,
+                                           "cleanup_test_data"),
             expected_results={
                 "data_corruption": "0%",
                 "checksum_validation": "100%",
@@ -301,11 +557,8 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="data_flow",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "setup_concurrent_test_environment"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "setup_concurrent_test_environment"),
             test_commands=[
                 "start_concurrent_data_access_test",
                 f"simulate_high_load {primary_agent}",
@@ -313,12 +566,9 @@ class IntegrationTestExecutor:
                 "monitor_race_conditions",
                 "verify_data_consistency"
             ],
-            cleanup_commands=[
-                "stop_concurrent_test",
-                "cleanup_concurrent_environment",
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent,
+                                           "stop_concurrent_test",
+                                           "cleanup_concurrent_environment"),
             expected_results={
                 "race_conditions": "0",
                 "deadlocks": "0",
@@ -342,22 +592,16 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="performance",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "setup_latency_monitoring"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "setup_latency_monitoring"),
             test_commands=[
                 "start_latency_measurement",
                 f"send_ping_requests {primary_agent} {secondary_agent} 1000",
                 "calculate_latency_statistics",
                 "verify_latency_targets"
             ],
-            cleanup_commands=[
-                "stop_latency_monitoring",
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent,
+                                           "stop_latency_monitoring"),
             expected_results={
                 "avg_latency": "< 10ms",
                 "max_latency": "< 50ms",
@@ -374,23 +618,17 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="performance",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "setup_throughput_monitoring"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "setup_throughput_monitoring"),
             test_commands=[
                 "start_throughput_measurement",
                 f"transfer_large_dataset {primary_agent} {secondary_agent}",
                 "calculate_throughput_statistics",
                 "verify_throughput_targets"
             ],
-            cleanup_commands=[
-                "stop_throughput_monitoring",
-                "cleanup_test_data",
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent,
+                                           "stop_throughput_monitoring",
+                                           "cleanup_test_data"),
             expected_results={
                 "throughput": "> 100 MB/s",
                 "cpu_utilization": "< 80%",
@@ -414,22 +652,16 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="security",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "setup_security_monitoring"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "setup_security_monitoring"),
             test_commands=[
                 "configure_access_restrictions",
                 f"test_authorized_access {primary_agent} {secondary_agent}",
                 f"test_unauthorized_access {primary_agent} {secondary_agent}",
                 "verify_access_control_enforcement"
             ],
-            cleanup_commands=[
-                "cleanup_security_configuration",
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent,
+                                           "cleanup_security_configuration"),
             expected_results={
                 "authorized_access": "allowed",
                 "unauthorized_access": "blocked",
@@ -446,22 +678,16 @@ class IntegrationTestExecutor:
             primary_agent=primary_agent,
             secondary_agents=[secondary_agent],
             test_type="security",
-            setup_commands=[
-                f"load_agent_module {primary_agent}",
-                f"load_agent_module {secondary_agent}",
-                "setup_encryption_monitoring"
-            ],
+            setup_commands=_case_setup(primary_agent, secondary_agent,
+                                       "setup_encryption_monitoring"),
             test_commands=[
                 "enable_encryption",
                 f"send_encrypted_data {primary_agent} {secondary_agent}",
                 "verify_encryption_in_transit",
                 "test_decryption_integrity"
             ],
-            cleanup_commands=[
-                "disable_encryption",
-                f"unload_agent_module {secondary_agent}",
-                f"unload_agent_module {primary_agent}"
-            ],
+            cleanup_commands=_case_cleanup(primary_agent, secondary_agent,
+                                           "disable_encryption"),
             expected_results={
                 "encryption_enabled": "true",
                 "data_encrypted": "100%",
@@ -472,111 +698,74 @@ class IntegrationTestExecutor:
         
         return test_cases
     
-    def _get_setup_commands(self, agent: str) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_setup_commands(agent: str) -> List[str]:
         """Get setup commands for agent-specific environment"""
-        
-        base_commands = [
-            "initialize_test_environment",
-            "setup_logging",
-            "create_temp_workspace"
-        ]
-        
-        agent_specific = {
-            "kernel-architect": [
-                "setup_kernel_test_environment",
-                "load_test_kernel_modules",
-                "initialize_memory_subsystem"
-            ],
-            "gaming-layer-engineer": [
-                "setup_graphics_test_environment",
-                "initialize_virtual_display",
-                "load_test_gpu_drivers"
-            ],
-            "raeen-studio-lead": [
-                "setup_ui_test_environment",
-                "initialize_test_database",
-                "start_test_services"
-            ]
-        }
-        
-        return base_commands + agent_specific.get(agent, [])
-    
-    def _get_cleanup_commands(self, agent: str) -> List[str]:
+
+        cls = IntegrationTestExecutor
+        return list(cls._BASE_SETUP_COMMANDS
+                    + cls._AGENT_SETUP_COMMANDS.get(agent, ()))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_cleanup_commands(agent: str) -> List[str]:
         """Get cleanup commands for agent-specific environment"""
-        
-        base_commands = [
-            "cleanup_temp_workspace",
-            "stop_logging",
-            "cleanup_test_environment"
-        ]
-        
-        agent_specific = {
-            "kernel-architect": [
-                "unload_test_kernel_modules",
-                "cleanup_memory_subsystem",
-                "restore_kernel_state"
-            ],
-            "gaming-layer-engineer": [
-                "unload_test_gpu_drivers",
-                "cleanup_virtual_display",
-                "restore_graphics_state"
-            ],
-            "raeen-studio-lead": [
-                "stop_test_services",
-                "cleanup_test_database",
-                "restore_ui_state"
-            ]
-        }
-        
-        return agent_specific.get(agent, []) + base_commands
+
+        cls = IntegrationTestExecutor
+        return list(cls._AGENT_CLEANUP_COMMANDS.get(agent, ())
+                    + cls._BASE_CLEANUP_COMMANDS)
     
-    def execute_test_case(self, test_case: IntegrationTestCase) -> IntegrationTestResult:
+    async def execute_test_case(self, test_case: IntegrationTestCase,
+                                suite_tmp: str) -> IntegrationTestResult:
         """Execute a single integration test case"""
-        
+
         print(f"  Executing: {test_case.name}")
-        
+
         start_time = time.time()
         stdout_lines = []
         stderr_lines = []
         return_code = 0
         error_message = None
         metrics = {}
-        
+
         try:
-            # Create temporary working directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                self.temp_dir = Path(temp_dir)
-                
-                # Execute setup commands
-                for cmd in test_case.setup_commands:
-                    result = self._execute_command(cmd, temp_dir)
+            # Per-case subdirectory of the suite scratch dir; the suite
+            # removes the whole tree in one pass
+            case_dir = os.path.join(suite_tmp, test_case.test_id)
+            os.mkdir(case_dir)
+
+            # Execute setup commands
+            for cmd in test_case.setup_commands:
+                result = await self._execute_command(cmd, case_dir)
+                if result.returncode != 0:
+                    error_message = f"Setup command failed: {cmd}"
+                    return_code = result.returncode
+                    break
+
+            # Execute test commands if setup succeeded, folding each
+            # command's metrics in as it completes instead of buffering
+            # every output blob for one big parse at the end
+            if return_code == 0:
+                for cmd in test_case.test_commands:
+                    result = await self._execute_command(cmd, case_dir)
+                    metrics.update(self._parse_test_metrics(result.stdout))
+                    if self.keep_raw_output:
+                        stdout_lines.append(result.stdout)
+                        stderr_lines.append(result.stderr)
+
                     if result.returncode != 0:
-                        error_message = f"Setup command failed: {cmd}"
+                        error_message = f"Test command failed: {cmd}"
                         return_code = result.returncode
                         break
-                
-                # Execute test commands if setup succeeded
-                if return_code == 0:
-                    for cmd in test_case.test_commands:
-                        result = self._execute_command(cmd, temp_dir)
-                        stdout_lines.append(result.stdout)
-                        stderr_lines.append(result.stderr)
-                        
-                        if result.returncode != 0:
-                            error_message = f"Test command failed: {cmd}"
-                            return_code = result.returncode
-                            break
-                
-                # Always execute cleanup commands
-                for cmd in test_case.cleanup_commands:
-                    try:
-                        self._execute_command(cmd, temp_dir)
-                    except Exception as e:
-                        print(f"Warning: Cleanup command failed: {cmd} - {e}")
-                
-                # Parse metrics from stdout
-                metrics = self._parse_test_metrics('\n'.join(stdout_lines))
-                
+
+            # Always execute cleanup commands
+            for cmd in test_case.cleanup_commands:
+                try:
+                    await self._execute_command(cmd, case_dir)
+                except Exception as e:
+                    print(f"Warning: Cleanup command failed: {cmd} - {e}")
+
         except Exception as e:
             error_message = f"Test execution error: {str(e)}"
             return_code = 1
@@ -599,160 +788,245 @@ class IntegrationTestExecutor:
             start_time=start_time,
             end_time=end_time,
             duration=end_time - start_time,
-            stdout='\n'.join(stdout_lines),
-            stderr='\n'.join(stderr_lines),
+            stdout='\n'.join(stdout_lines) if stdout_lines else "",
+            stderr='\n'.join(stderr_lines) if stderr_lines else "",
             return_code=return_code,
-            metrics=metrics,
+            # Strip the numeric tags; reports carry plain values
+            metrics={key: value for key, (_, value) in metrics.items()},
             error_message=error_message
         )
     
-    def _execute_command(self, command: str, working_dir: str) -> subprocess.CompletedProcess:
-        """Execute a test command"""
-        
-        # In a real implementation, this would map test commands to actual executables
-        # For demonstration, we'll simulate command execution
-        
-        if command.startswith("load_agent_module"):
-            # Simulate loading an agent module
-            time.sleep(0.1)
-            return subprocess.CompletedProcess(
-                args=[command], returncode=0, stdout="Module loaded successfully", stderr=""
-            )
-        elif command.startswith("validate_interface_contract"):
-            # Simulate interface validation
-            time.sleep(0.5)
-            return subprocess.CompletedProcess(
-                args=[command], returncode=0, 
-                stdout="contract_validation=pass\napi_endpoints_tested=15\ndata_structure_compatibility=100%", 
-                stderr=""
-            )
-        elif command.startswith("test_error_handling"):
-            # Simulate error handling test
-            time.sleep(0.3)
-            return subprocess.CompletedProcess(
-                args=[command], returncode=0,
-                stdout="error_handling=graceful\nsystem_stability=maintained\nrecovery_time=2.3",
-                stderr=""
-            )
-        elif command.startswith("send_ping_requests"):
-            # Simulate latency test
-            time.sleep(1.0)
-            return subprocess.CompletedProcess(
-                args=[command], returncode=0,
-                stdout="avg_latency=7.2\nmax_latency=15.8\nlatency_jitter=2.1",
-                stderr=""
-            )
-        else:
-            # Default simulation
-            time.sleep(0.1)
-            return subprocess.CompletedProcess(
-                args=[command], returncode=0, stdout=f"Command executed: {command}", stderr=""
-            )
+    async def _execute_command(self, command: str, working_dir: str) -> subprocess.CompletedProcess:
+        """Execute a test command.
+
+        A real backend would await asyncio.create_subprocess_exec with
+        communicate() here; the simulation awaits its delays instead of
+        blocking, so hundreds of cases share one thread.
+        """
+        # Dispatch on the command verb through a handler table - one hash
+        # lookup instead of a prefix-check cascade
+        verb = command.partition(' ')[0]
+        return await _CMD_HANDLERS.get(verb, _handle_default)(command)
     
-    def _parse_test_metrics(self, stdout: str) -> Dict[str, Any]:
-        """Parse metrics from test output"""
-        
+    def _parse_test_metrics(self, stdout: str) -> Dict[str, Tuple[bool, Any]]:
+        """Parse metrics from test output as (is_numeric, value) pairs.
+
+        Tagging numeric values once here lets the validation predicates
+        skip per-metric isinstance checks.
+        """
+        # One precompiled multiline scan instead of a per-line split loop;
+        # the numeric-shape test replaces try/except float control flow
         metrics = {}
-        
-        for line in stdout.split('\n'):
-            if '=' in line and not line.startswith('Command executed'):
-                try:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Try to convert to appropriate type
-                    try:
-                        metrics[key] = float(value)
-                    except ValueError:
-                        metrics[key] = value
-                except ValueError:
-                    continue
-        
+        for key, value in _METRIC_RE.findall(stdout):
+            value = value.strip()
+            # Interned keys match the interned expected_results keys by
+            # identity in the validation lookups
+            key = sys.intern(key.strip())
+            if _NUMERIC_RE.match(value):
+                metrics[key] = (True, float(value))
+            else:
+                metrics[key] = (False, value)
         return metrics
     
-    def _validate_expected_results(self, test_case: IntegrationTestCase, metrics: Dict[str, Any]) -> bool:
-        """Validate test results against expected outcomes"""
-        
-        for expected_key, expected_value in test_case.expected_results.items():
-            if expected_key not in metrics:
+    def _validate_expected_results(self, test_case: IntegrationTestCase,
+                                   metrics: Dict[str, Tuple[bool, Any]]) -> bool:
+        """Validate tagged test metrics against expected outcomes"""
+
+        for expected_key, predicate in test_case._compiled_expected.items():
+            tagged = metrics.get(expected_key)
+            if tagged is None:
                 print(f"    Missing expected metric: {expected_key}")
                 return False
-            
-            actual_value = metrics[expected_key]
-            
-            # Handle different comparison types
-            if isinstance(expected_value, str):
-                if expected_value.startswith('>'):
-                    threshold = float(expected_value[1:].strip())
-                    if not (isinstance(actual_value, (int, float)) and actual_value > threshold):
-                        print(f"    Metric {expected_key}: {actual_value} not > {threshold}")
-                        return False
-                elif expected_value.startswith('<'):
-                    threshold = float(expected_value[1:].strip())
-                    if not (isinstance(actual_value, (int, float)) and actual_value < threshold):
-                        print(f"    Metric {expected_key}: {actual_value} not < {threshold}")
-                        return False
-                elif expected_value != str(actual_value):
-                    print(f"    Metric {expected_key}: {actual_value} != {expected_value}")
-                    return False
-            elif expected_value != actual_value:
-                print(f"    Metric {expected_key}: {actual_value} != {expected_value}")
+
+            if not predicate(tagged):
+                expected_value = test_case.expected_results[expected_key]
+                print(f"    Metric {expected_key}: {tagged[1]} failed expectation {expected_value!r}")
                 return False
-        
+
         return True
     
-    def execute_test_suite(self, test_suite: IntegrationTestSuite) -> Dict[str, Any]:
-        """Execute a complete integration test suite"""
+    def execute_test_suite(self, test_suite: IntegrationTestSuite,
+                           report_path: Optional[str] = None,
+                           collect_details: bool = True) -> Dict[str, Any]:
+        """Execute a complete integration test suite.
+
+        When report_path is given, results are appended to it as JSON
+        lines while the suite runs, memory stays O(1) per test, and the
+        returned dict carries only the summary. collect_details=False
+        does the same for callers that only need the summary counters,
+        skipping the per-case result list entirely.
+        """
         
         print(f"Executing integration test suite: {test_suite.name}")
         print(f"Primary agent: {test_suite.primary_agent}")
         print(f"Test cases: {len(test_suite.test_cases)}")
         
         suite_start_time = time.time()
+
+        # One scratch dir for the whole suite; each case gets a cheap
+        # subdirectory instead of its own mkdtemp/rmtree round trip.
+        counts = {status: 0 for status in TestStatus}
+        durations = []
         results = []
-        
-        # Execute all test cases
-        for test_case in test_suite.test_cases:
-            result = self.execute_test_case(test_case)
-            results.append(result)
-        
+        report_fp = open(report_path, 'wb') if report_path else None
+
+        def on_result(result: IntegrationTestResult):
+            counts[result.status] += 1
+            durations.append(result.duration)
+            if report_fp is not None:
+                report_fp.write(_dumps_jsonl(result.to_dict()))
+            elif collect_details:
+                results.append(result)
+
+        # Test cases are independent and dominated by command waits, so
+        # they all run as coroutines on one event loop, bounded by
+        # max_workers. With a report path, each result streams to disk as
+        # it completes and only the status counts stay in memory
+        try:
+            with tempfile.TemporaryDirectory() as suite_tmp:
+                asyncio.run(self._execute_suite_async(test_suite, suite_tmp, on_result))
+        finally:
+            if report_fp is not None:
+                report_fp.close()
+
         suite_end_time = time.time()
-        
+
         # Generate summary
-        passed_count = sum(1 for r in results if r.status == TestStatus.PASSED)
-        failed_count = sum(1 for r in results if r.status == TestStatus.FAILED)
-        error_count = sum(1 for r in results if r.status == TestStatus.ERROR)
-        
+        total_tests = sum(counts.values())
+        passed_count = counts[TestStatus.PASSED]
+
         suite_result = {
             "suite": test_suite.to_dict(),
             "summary": {
-                "total_tests": len(results),
+                "total_tests": total_tests,
                 "passed": passed_count,
-                "failed": failed_count,
-                "errors": error_count,
-                "success_rate": (passed_count / len(results)) * 100 if results else 0,
+                "failed": counts[TestStatus.FAILED],
+                "errors": counts[TestStatus.ERROR],
+                "success_rate": (passed_count / total_tests) * 100 if total_tests else 0,
                 "start_time": suite_start_time,
                 "end_time": suite_end_time,
-                "duration": suite_end_time - suite_start_time
-            },
-            "results": [r.to_dict() for r in results]
+                "duration": suite_end_time - suite_start_time,
+                "case_duration_stats": _aggregate_durations(durations)
+            }
         }
-        
+        if report_fp is None and collect_details:
+            suite_result["results"] = [r.to_dict() for r in results]
+
         return suite_result
 
+    async def _execute_suite_async(self, test_suite: IntegrationTestSuite,
+                                   suite_tmp: str, on_result) -> None:
+        """Drive suite setup, concurrent case execution and cleanup.
+
+        Cases run under a semaphore sized to max_workers; each gets a
+        real timeout via asyncio.wait_for (previously timeout_seconds was
+        never enforced) and is handed to on_result as it finishes.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run_case(test_case: IntegrationTestCase) -> IntegrationTestResult:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.execute_test_case(test_case, suite_tmp),
+                        timeout=test_case.timeout_seconds)
+                except asyncio.TimeoutError:
+                    now = time.time()
+                    return IntegrationTestResult(
+                        test_case=test_case,
+                        status=TestStatus.ERROR,
+                        start_time=now - test_case.timeout_seconds,
+                        end_time=now,
+                        duration=float(test_case.timeout_seconds),
+                        stdout="",
+                        stderr="",
+                        return_code=-1,
+                        metrics={},
+                        error_message=f"Test timed out after {test_case.timeout_seconds}s"
+                    )
+
+        # Suite-level setup loads each unique agent module once
+        for cmd in test_suite.setup_commands:
+            await self._execute_command(cmd, suite_tmp)
+
+        try:
+            tasks = [asyncio.create_task(run_case(tc)) for tc in test_suite.test_cases]
+            for task in asyncio.as_completed(tasks):
+                on_result(await task)
+        finally:
+            for cmd in test_suite.cleanup_commands:
+                try:
+                    await self._execute_command(cmd, suite_tmp)
+                except Exception as e:
+                    print(f"Warning: Suite cleanup command failed: {cmd} - {e}")
+
+_USAGE = """\
+RaeenOS Integration Test Framework
+
+usage: integration_test_framework.py --primary-agent AGENT [options]
+
+  --primary-agent AGENT    Primary agent to test (required)
+  --related-agents LIST    Comma-separated list of related agents
+  --component-path PATH    Path to component code (default: .)
+  --output FILE            Output file for results (JSON format)
+  --project-root PATH      Project root directory (default: cwd)
+  --max-workers N          Concurrent test cases (default: min(32, 4*cpus))
+  --jobs N                 Alias for --max-workers
+  --verbose                Retain raw command output in results
+"""
+
+def _parse_args(argv: List[str]) -> types.SimpleNamespace:
+    """Minimal CLI parser; argparse's import tree costs more than the
+    whole parse for this handful of fixed options."""
+
+    args = types.SimpleNamespace(
+        primary_agent=None,
+        related_agents=None,
+        component_path=".",
+        output=None,
+        project_root=os.getcwd(),
+        max_workers=min(32, (os.cpu_count() or 1) * 4),
+        verbose=False,
+    )
+
+    i = 0
+    while i < len(argv):
+        opt, _, inline = argv[i].partition('=')
+        if opt in ("-h", "--help"):
+            print(_USAGE)
+            raise SystemExit(0)
+        if opt == "--verbose":
+            args.verbose = True
+            i += 1
+            continue
+        if opt not in ("--primary-agent", "--related-agents", "--component-path",
+                       "--output", "--project-root", "--max-workers", "--jobs"):
+            print(f"error: unrecognized argument: {argv[i]}\n\n{_USAGE}",
+                  file=sys.stderr)
+            raise SystemExit(2)
+        if not inline:
+            if i + 1 >= len(argv):
+                print(f"error: {opt} expects a value", file=sys.stderr)
+                raise SystemExit(2)
+            inline = argv[i + 1]
+            i += 1
+        i += 1
+        if opt in ("--max-workers", "--jobs"):
+            args.max_workers = int(inline)
+        else:
+            setattr(args, opt[2:].replace('-', '_'), inline)
+
+    if not args.primary_agent:
+        print(f"error: --primary-agent is required\n\n{_USAGE}", file=sys.stderr)
+        raise SystemExit(2)
+    return args
+
 def main():
-    parser = argparse.ArgumentParser(description="RaeenOS Integration Test Framework")
-    parser.add_argument("--primary-agent", required=True, help="Primary agent to test")
-    parser.add_argument("--related-agents", help="Comma-separated list of related agents")
-    parser.add_argument("--component-path", default=".", help="Path to component code")
-    parser.add_argument("--output", help="Output file for results (JSON format)")
-    parser.add_argument("--project-root", default=os.getcwd(), help="Project root directory")
-    
-    args = parser.parse_args()
-    
+    args = _parse_args(sys.argv[1:])
+
     # Create test executor
-    executor = IntegrationTestExecutor(args.project_root)
+    executor = IntegrationTestExecutor(args.project_root, max_workers=args.max_workers,
+                                       keep_raw_output=args.verbose)
     
     # Generate test suite
     test_suite = executor.generate_integration_tests(args.primary_agent)
@@ -761,22 +1035,24 @@ def main():
         print(f"No integration tests generated for {args.primary_agent}")
         sys.exit(0)
     
-    # Execute test suite
-    suite_result = executor.execute_test_suite(test_suite)
-    
+    # Execute test suite; a .jsonl output streams results as they complete
+    stream_output = args.output if args.output and args.output.endswith('.jsonl') else None
+    suite_result = executor.execute_test_suite(test_suite, report_path=stream_output,
+                                               collect_details=bool(args.output))
+
     # Output results
-    result_json = json.dumps(suite_result, indent=2)
-    
-    if args.output:
-        with open(args.output, 'w') as f:
-            f.write(result_json)
+    if stream_output:
+        print(f"\nResults streamed to {stream_output}")
+    elif args.output:
+        pretty = sys.stdout.isatty() and not os.environ.get('CI')
+        write_report(args.output, suite_result, pretty=pretty)
         print(f"\nResults written to {args.output}")
-    else:
-        print("\nIntegration Test Results:")
-        print(json.dumps(suite_result['summary'], indent=2))
-    
-    # Print summary
+    # Keep only the small summary alive past this point so the big
+    # result tree can be reclaimed before the process winds down
     summary = suite_result['summary']
+    del suite_result, test_suite
+
+    # Print summary
     print(f"\nIntegration Test Summary for {args.primary_agent}:")
     print(f"  Total tests: {summary['total_tests']}")
     print(f"  Passed: {summary['passed']}")
@@ -785,13 +1061,15 @@ def main():
     print(f"  Success rate: {summary['success_rate']:.1f}%")
     print(f"  Duration: {summary['duration']:.2f} seconds")
     
-    # Exit with appropriate code
-    if summary['failed'] > 0 or summary['errors'] > 0:
-        print(f"\nIntegration tests FAILED for {args.primary_agent}")
-        sys.exit(1)
-    else:
-        print(f"\nIntegration tests PASSED for {args.primary_agent}")
-        sys.exit(0)
+    # Exit with appropriate code. os._exit skips interpreter teardown,
+    # which would otherwise walk and free the whole result tree; with
+    # everything flushed there is nothing left for shutdown to do
+    failed = summary['failed'] > 0 or summary['errors'] > 0
+    verdict = "FAILED" if failed else "PASSED"
+    print(f"\nIntegration tests {verdict} for {args.primary_agent}")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(1 if failed else 0)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file